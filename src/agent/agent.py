@@ -79,7 +79,7 @@ class Agent:
                 raise
 
         # Prepare tools
-        tools = CLUSTER_TOOLS.copy()
+        tools = list(CLUSTER_TOOLS)
         if mcp_tools:
             tools.extend(mcp_tools)
             logger.info(f"Registered {len(mcp_tools)} MCP tools")
@@ -20,6 +20,7 @@ from rich.markdown import Markdown
 
 from agent import __version__
 from agent.agent import Agent
+from agent.cluster.tools import shutdown_tools
 from agent.config import AgentConfig
 from agent.observability import initialize_observability
 from agent.persistence import ThreadPersistence
@@ -1150,19 +1151,27 @@ async def async_main() -> None:
         run_config_command()
         return
 
-    # Handle single query mode
-    if args.prompt:
-        await run_single_query(args.prompt, quiet=args.quiet, verbose=args.verbose)
-    else:
-        # Handle --continue flag
-        resume_session = None
-        if args.continue_session:
-            resume_session = _get_last_session()
-            if not resume_session:
-                console.print("[yellow]No previous session found. Starting new session.[/yellow]\n")
-
-        # Interactive chat mode
-        await run_chat_mode(quiet=args.quiet, verbose=args.verbose, resume_session=resume_session)
+    try:
+        # Handle single query mode
+        if args.prompt:
+            await run_single_query(args.prompt, quiet=args.quiet, verbose=args.verbose)
+        else:
+            # Handle --continue flag
+            resume_session = None
+            if args.continue_session:
+                resume_session = _get_last_session()
+                if not resume_session:
+                    console.print(
+                        "[yellow]No previous session found. Starting new session.[/yellow]\n"
+                    )
+
+            # Interactive chat mode
+            await run_chat_mode(
+                quiet=args.quiet, verbose=args.verbose, resume_session=resume_session
+            )
+    finally:
+        # Close kubectl proxies and their HTTP session while the event loop is still running
+        await shutdown_tools()
 
 
 def main() -> None:
@@ -67,7 +67,8 @@ class BaseAddon(ABC):
             HelmCommandError: If command fails and check=True
         """
         cmd = ["helm"] + args
-        logger.debug(f"Running helm command: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Running helm command: {' '.join(cmd)}")
 
         try:
             env = os.environ.copy()
@@ -227,6 +228,39 @@ class BaseAddon(ABC):
         """
         return {}
 
+    def get_all_requirements(self) -> dict[str, Any]:
+        """Return all pre-creation requirements for this addon in one call.
+
+        **PRE-CREATION HOOK CONTRACT**: See get_cluster_config_requirements() for
+        contract details. This method must not access kubeconfig or cluster state.
+
+        The default implementation combines get_cluster_config_requirements(),
+        get_port_requirements() and get_node_labels(). Override it to compute all
+        requirements together when they share work.
+
+        Returns:
+            Dict in the format accepted by merge_addon_requirements(): cluster config
+            patches at the top level, plus optional "port_mappings" and "node_labels"
+            keys. Empty if the addon needs no configuration.
+
+        Example:
+            {
+                "port_mappings": [{"containerPort": 80, "hostPort": 80, "protocol": "TCP"}],
+                "node_labels": {"ingress-ready": "true"}
+            }
+        """
+        requirements: dict[str, Any] = dict(self.get_cluster_config_requirements())
+
+        port_mappings = self.get_port_requirements()
+        if port_mappings:
+            requirements["port_mappings"] = port_mappings
+
+        node_labels = self.get_node_labels()
+        if node_labels:
+            requirements["node_labels"] = node_labels
+
+        return requirements
+
     @abstractmethod
     async def check_prerequisites(self) -> bool:
         """Check if prerequisites for addon installation are met.
@@ -1,12 +1,12 @@
 """KinD cluster configuration templates and management."""
 
+import copy
 import threading
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 # Template directory containing built-in KinD configurations
 _TEMPLATE_DIR = Path(__file__).parent / "templates"
 
@@ -86,6 +86,33 @@ def _get_template(template_name: str) -> str:
     return template
 
 
+@lru_cache(maxsize=32)
+def _parse_config_cached(content: str) -> Any:
+    """Parse configuration YAML once per distinct content."""
+    import yaml
+
+    # Prefer libyaml's C loader; fall back to pure Python.
+    return yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def parse_cluster_config(content: str) -> Any:
+    """Parse KinD configuration YAML.
+
+    Parsed results are cached by content, so the static templates are only parsed
+    once. Each caller gets its own deep copy and may mutate it freely.
+
+    Args:
+        content: Configuration YAML string
+
+    Returns:
+        Parsed configuration (a dict for valid KinD configs)
+
+    Raises:
+        yaml.YAMLError: If the YAML is invalid
+    """
+    return copy.deepcopy(_parse_config_cached(content))
+
+
 def discover_config_file(
     cluster_name: str, data_dir: Path | None = None
 ) -> tuple[Path | None, str]:
@@ -142,9 +169,11 @@ def load_config_from_file(filepath: Path, cluster_name: str) -> str:
     # Replace {name} placeholder with actual cluster name
     config_content = config_content.replace("{name}", cluster_name)
 
-    # Validate YAML syntax
+    import yaml
+
+    # Validate YAML syntax (the parse is cached for the create path to reuse)
     try:
-        yaml.safe_load(config_content)
+        _parse_config_cached(config_content)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in configuration file {filepath}: {e}") from e
 
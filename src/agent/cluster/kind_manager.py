@@ -8,6 +8,7 @@ import tempfile
 import time
 from pathlib import Path
 
+from agent.utils import json_compat
 from agent.utils.async_subprocess import run_async
 from agent.utils.errors import (
     ClusterAlreadyExistsError,
@@ -67,6 +68,37 @@ class KindManager:
         Returns:
             Dict with cluster information
 
+        Raises:
+            ClusterAlreadyExistsError: If cluster already exists
+            KindCommandError: If cluster creation fails
+        """
+        # Write config to temporary file
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write(config)
+            config_path = Path(f.name)
+
+        try:
+            return await self.create_cluster_from_file(name, config_path, k8s_version)
+        finally:
+            # Clean up temporary config file
+            config_path.unlink(missing_ok=True)
+
+    async def create_cluster_from_file(
+        self,
+        name: str,
+        config_path: Path,
+        k8s_version: str | None = None,
+    ) -> dict:
+        """Create a new KinD cluster from a configuration file asynchronously.
+
+        Args:
+            name: Cluster name
+            config_path: Path to cluster configuration YAML
+            k8s_version: Kubernetes version (e.g., v1.34.0)
+
+        Returns:
+            Dict with cluster information
+
         Raises:
             ClusterAlreadyExistsError: If cluster already exists
             KindCommandError: If cluster creation fails
@@ -79,44 +111,34 @@ class KindManager:
         if await self.cluster_exists(name):
             raise ClusterAlreadyExistsError(f"Cluster '{name}' already exists")
 
-        # Write config to temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(config)
-            config_path = f.name
-
-        try:
-            # Build command
-            cmd = ["kind", "create", "cluster", "--name", name, "--config", config_path]
-            if k8s_version:
-                cmd.extend(["--image", f"kindest/node:{k8s_version}"])
-
-            logger.info(f"Creating cluster '{name}' with config: {config_path}")
+        # Build command
+        cmd = ["kind", "create", "cluster", "--name", name, "--config", str(config_path)]
+        if k8s_version:
+            cmd.extend(["--image", f"kindest/node:{k8s_version}"])
 
-            # Execute command asynchronously
-            result = await run_async(
-                cmd,
-                timeout=300,  # 5 minutes timeout
-                check=False,
-                capture_output=True,
-            )
+        logger.info(f"Creating cluster '{name}' with config: {config_path}")
 
-            if result.returncode != 0:
-                error_msg = result.stderr or result.stdout
-                raise KindCommandError(f"Failed to create cluster '{name}': {error_msg}")
+        # Execute command asynchronously
+        result = await run_async(
+            cmd,
+            timeout=300,  # 5 minutes timeout
+            check=False,
+            capture_output=True,
+        )
 
-            logger.info(f"Cluster '{name}' created successfully")
+        if result.returncode != 0:
+            error_msg = result.stderr or result.stdout
+            raise KindCommandError(f"Failed to create cluster '{name}': {error_msg}")
 
-            # Get cluster info
-            return {
-                "cluster_name": name,
-                "status": "running",
-                "kubernetes_version": k8s_version or "latest",
-                "nodes": await self._get_node_count(name),
-            }
+        logger.info(f"Cluster '{name}' created successfully")
 
-        finally:
-            # Clean up temporary config file
-            Path(config_path).unlink(missing_ok=True)
+        # Get cluster info
+        return {
+            "cluster_name": name,
+            "status": "running",
+            "kubernetes_version": k8s_version or "latest",
+            "nodes": await self._get_node_count(name),
+        }
 
     async def delete_cluster(self, name: str) -> dict:
         """Delete a KinD cluster asynchronously.
@@ -200,12 +222,20 @@ class KindManager:
         Returns:
             True if cluster exists
         """
+        # Probe this cluster's node containers directly rather than listing every
+        # cluster. Stopped clusters still have (stopped) node containers.
         try:
-            clusters = await self.list_clusters()
-            return name in clusters
-        except KindCommandError:
+            result = await run_async(
+                ["kind", "get", "nodes", "--name", name],
+                timeout=10,
+                check=False,
+                capture_output=True,
+            )
+        except (TimeoutError, FileNotFoundError):
             return False
 
+        return result.returncode == 0 and bool(result.stdout.strip())
+
     async def get_kubeconfig(self, name: str) -> str:
         """Get kubeconfig for a cluster asynchronously.
 
@@ -241,6 +271,50 @@ class KindManager:
         except TimeoutError as e:
             raise KindCommandError(f"Timeout while getting kubeconfig for '{name}'") from e
 
+    async def write_kubeconfig(self, name: str, dest: Path) -> None:
+        """Write kubeconfig for a cluster straight to a file asynchronously.
+
+        kind's stdout is redirected into the file, so the kubeconfig is never read
+        into Python. Output goes to a temporary sibling that is renamed into place
+        only on success, so a failed export never clobbers an existing kubeconfig.
+
+        Args:
+            name: Cluster name
+            dest: Kubeconfig file to write (its directory must exist)
+
+        Raises:
+            KindCommandError: If getting kubeconfig fails
+        """
+        validate_cluster_name(name)
+
+        tmp_path = dest.with_name(f".{dest.name}.tmp")
+        try:
+            with open(tmp_path, "wb") as out:
+                process = await asyncio.create_subprocess_exec(
+                    "kind",
+                    "get",
+                    "kubeconfig",
+                    "--name",
+                    name,
+                    stdout=out,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                try:
+                    _, stderr = await asyncio.wait_for(process.communicate(), timeout=10)
+                except TimeoutError as e:
+                    process.kill()
+                    await process.wait()
+                    raise KindCommandError(f"Timeout while getting kubeconfig for '{name}'") from e
+
+            if process.returncode != 0:
+                raise KindCommandError(
+                    f"Failed to get kubeconfig for '{name}': {stderr.decode('utf-8').strip()}"
+                )
+
+            tmp_path.replace(dest)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
     async def start_cluster(self, name: str) -> dict:
         """Start a stopped KinD cluster asynchronously.
 
@@ -560,7 +634,7 @@ class KindManager:
             )
 
             if result.returncode == 0:
-                data = json.loads(result.stdout)
+                data = json_compat.loads(result.stdout_bytes)
                 return len(data.get("items", []))
 
         except (TimeoutError, json.JSONDecodeError, FileNotFoundError) as e:
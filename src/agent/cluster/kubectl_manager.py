@@ -1,14 +1,22 @@
 """Kubectl resource management operations with async subprocess support."""
 
+import asyncio
+import atexit
+import hashlib
 import json
 import logging
+import os
+import re
+import shutil
+import signal
 import subprocess
 import tempfile
+import time
+from collections.abc import AsyncIterator
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-import yaml
+from typing import TYPE_CHECKING, Any
 
+from agent.utils import json_compat
 from agent.utils.async_subprocess import AsyncCompletedProcess, run_async
 from agent.utils.errors import (
     ClusterNotFoundError,
@@ -23,6 +31,152 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Matches kubectl "NotFound" / "not found" errors without lowercasing stderr
+_NOT_FOUND_RE = re.compile(r"not ?found", re.IGNORECASE)
+
+# Objects requested per page when listing through kubectl proxy (kubectl's own default)
+_PROXY_PAGE_SIZE = 500
+
+# Upper bound on kubectl processes running concurrently against a single cluster
+_MAX_CONCURRENT_PER_CLUSTER = 4
+
+# Seconds a successful `kubectl cluster-info` check is trusted before running it again
+_VALIDATION_TTL = 30.0
+
+# kubectl errors meaning the API server cannot be reached (cluster stopped or deleted)
+_UNREACHABLE_RE = re.compile(
+    r"connection refused|was refused|unable to connect to the server|no route to host"
+    r"|no such host|i/o timeout",
+    re.IGNORECASE,
+)
+
+# Longest log line buffered whole by stream_logs; longer lines are yielded in pieces
+_STREAM_LINE_LIMIT = 1024 * 1024
+
+# Bytes of stderr kept from a `kubectl logs --follow` process for error reporting
+_STREAM_STDERR_TAIL = 64 * 1024
+
+# First line printed by `kubectl proxy --port=0` once it is listening
+_PROXY_PORT_RE = re.compile(rb"Starting to serve on [^\s]+:(\d+)")
+
+# Read-only resource types served through the kubectl proxy REST API:
+# resource type -> (API group path, namespaced)
+_PROXY_PATHS: dict[str, tuple[str, bool]] = {
+    "pods": ("/api/v1", True),
+    "services": ("/api/v1", True),
+    "configmaps": ("/api/v1", True),
+    "secrets": ("/api/v1", True),
+    "endpoints": ("/api/v1", True),
+    "events": ("/api/v1", True),
+    "serviceaccounts": ("/api/v1", True),
+    "persistentvolumeclaims": ("/api/v1", True),
+    "nodes": ("/api/v1", False),
+    "namespaces": ("/api/v1", False),
+    "persistentvolumes": ("/api/v1", False),
+    "deployments": ("/apis/apps/v1", True),
+    "statefulsets": ("/apis/apps/v1", True),
+    "daemonsets": ("/apis/apps/v1", True),
+    "replicasets": ("/apis/apps/v1", True),
+    "jobs": ("/apis/batch/v1", True),
+    "cronjobs": ("/apis/batch/v1", True),
+    "ingresses": ("/apis/networking.k8s.io/v1", True),
+}
+
+
+# Distinct manifests whose parse result is remembered by _check_manifest_yaml
+_MANIFEST_CACHE_SIZE = 64
+
+# blake2b digests of manifests that parsed cleanly, least recently used first
+_checked_manifests: dict[bytes, None] = {}
+
+
+def _check_manifest_yaml(manifest: str) -> None:
+    """Parse every document of a manifest once per distinct content.
+
+    Agents often re-apply the same manifest, so only the first apply pays for the
+    parse. Manifests are remembered by digest rather than by their full text, and
+    failures are not cached.
+
+    Args:
+        manifest: YAML manifest content (may hold multiple documents)
+
+    Raises:
+        yaml.YAMLError: If any document is invalid YAML
+    """
+    digest = hashlib.blake2b(manifest.encode()).digest()
+    if digest in _checked_manifests:
+        # Re-insert to mark it most recently used
+        _checked_manifests[digest] = _checked_manifests.pop(digest)
+        return
+
+    import yaml
+
+    # Prefer libyaml's C loader; fall back to pure Python.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    for _ in yaml.load_all(manifest, Loader=loader):
+        pass
+
+    _checked_manifests[digest] = None
+    if len(_checked_manifests) > _MANIFEST_CACHE_SIZE:
+        del _checked_manifests[next(iter(_checked_manifests))]
+
+
+async def _iter_lines(stream: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    """Yield lines from a stream, splitting any line longer than its buffer limit.
+
+    ``async for`` over a StreamReader raises ValueError on a line longer than the
+    reader's limit; this yields such a line in buffer-sized pieces instead.
+
+    Args:
+        stream: Reader to consume until EOF
+
+    Yields:
+        Lines including their trailing newline (the last may lack one)
+    """
+    split = False
+    while True:
+        try:
+            line = await stream.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                yield e.partial
+            return
+        except asyncio.LimitOverrunError as e:
+            split = True
+            yield await stream.readexactly(e.consumed)
+            continue
+        # The newline ending a split line arrives alone; it is not a line of its own
+        if not (split and line == b"\n"):
+            yield line
+        split = False
+
+
+async def _read_tail(stream: asyncio.StreamReader, max_bytes: int) -> bytes:
+    """Read a stream to EOF, keeping only its last ``max_bytes`` bytes.
+
+    Args:
+        stream: Reader to drain
+        max_bytes: Number of trailing bytes to keep
+
+    Returns:
+        The tail of the stream's content
+    """
+    tail = b""
+    while chunk := await stream.read(max_bytes):
+        tail = (tail + chunk)[-max_bytes:]
+    return tail
+
+
+class _ClusterSlots:
+    """Semaphore capping one cluster's kubectl processes and the number of callers
+    holding or awaiting it."""
+
+    __slots__ = ("semaphore", "users")
+
+    def __init__(self) -> None:
+        self.semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PER_CLUSTER)
+        self.users = 0
+
 
 class KubectlManager:
     """Manager for kubectl operations on Kubernetes clusters."""
@@ -35,6 +189,23 @@ class KubectlManager:
         """
         self.config = config
         self._check_kubectl_available()
+        # Resolved once so PATH isn't searched on every exec
+        self._kubectl = shutil.which("kubectl") or "kubectl"
+        # Opt-in: keep one `kubectl proxy` per cluster and serve list queries over HTTP
+        self._use_proxy: bool = config.kubectl_proxy
+        self._proxies: dict[str, tuple[asyncio.subprocess.Process, int]] = {}
+        # Per-cluster startup locks, so a slow proxy start only blocks its own cluster
+        self._proxy_locks: dict[str, asyncio.Lock] = {}
+        self._proxy_atexit_registered = False
+        self._http: Any = None
+        # Per-kubeconfig semaphores so one slow cluster cannot monopolize child processes;
+        # only kubeconfigs with a kubectl call running or queued have an entry
+        self._cluster_slots: dict[str, _ClusterSlots] = {}
+        # Process-wide cap so bursts of parallel tool calls cannot fork-storm the host
+        self._kubectl_slots = asyncio.Semaphore(config.kubectl_max_concurrency)
+        # Clusters that recently passed the cluster-info check:
+        # name -> (time.monotonic() of the check, kubeconfig mtime)
+        self._validated: dict[str, tuple[float, int]] = {}
 
     def _check_kubectl_available(self) -> None:
         """Check if kubectl CLI is available.
@@ -71,11 +242,33 @@ class KubectlManager:
         """
         return self.config.get_kubeconfig_path(cluster_name)
 
-    async def _validate_kubeconfig(self, cluster_name: str) -> Path:
+    @staticmethod
+    def _budget(timeout: float, deadline: float | None) -> float:
+        """Clamp a per-call timeout to the time left before a deadline.
+
+        Args:
+            timeout: Default timeout for the call in seconds
+            deadline: Optional ``time.monotonic()`` deadline for the whole operation
+
+        Returns:
+            Timeout to use for the call
+
+        Raises:
+            KubectlCommandError: If the deadline has already passed
+        """
+        if deadline is None:
+            return timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise KubectlCommandError("Deadline exceeded before kubectl command could run")
+        return min(timeout, remaining)
+
+    async def _validate_kubeconfig(self, cluster_name: str, deadline: float | None = None) -> Path:
         """Validate kubeconfig exists and cluster is accessible asynchronously.
 
         Args:
             cluster_name: Cluster name
+            deadline: Optional ``time.monotonic()`` deadline for the check
 
         Returns:
             Path to validated kubeconfig file
@@ -87,19 +280,37 @@ class KubectlManager:
         kubeconfig_path = self._get_kubeconfig_path(cluster_name)
 
         if not kubeconfig_path.exists():
+            self._validated.pop(cluster_name, None)
             raise KubeconfigNotFoundError(
                 f"Kubeconfig not found for cluster '{cluster_name}'. "
                 f"Expected at: {kubeconfig_path}"
             )
 
+        # Skip the cluster-info round trip if this kubeconfig was checked recently.
+        # A rewritten kubeconfig (cluster recreated) changes the mtime and forces a recheck.
+        try:
+            mtime: int | None = kubeconfig_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        validated = self._validated.get(cluster_name)
+        if (
+            validated is not None
+            and validated[1] == mtime
+            and time.monotonic() - validated[0] < _VALIDATION_TTL
+        ):
+            return kubeconfig_path
+
         # Verify cluster is accessible
+        self._validated.pop(cluster_name, None)
         try:
-            result = await run_async(
-                ["kubectl", "cluster-info", "--kubeconfig", str(kubeconfig_path)],
-                timeout=10,
-                check=False,
-                capture_output=True,
-            )
+            async with self._kubectl_slots:
+                timeout = self._budget(10, deadline)
+                result = await run_async(
+                    [self._kubectl, "cluster-info", "--kubeconfig", str(kubeconfig_path)],
+                    timeout=timeout,
+                    check=False,
+                    capture_output=True,
+                )
             if result.returncode != 0:
                 raise ClusterNotFoundError(
                     f"Cluster '{cluster_name}' is not accessible. It may be stopped or deleted. Try starting it first."
@@ -109,10 +320,16 @@ class KubectlManager:
                 f"Timeout connecting to cluster '{cluster_name}'. The cluster may be stopped."
             ) from e
 
+        if mtime is not None:
+            self._validated[cluster_name] = (time.monotonic(), mtime)
         return kubeconfig_path
 
     async def _run_kubectl(
-        self, args: list[str], kubeconfig_path: Path, timeout: int = 30
+        self,
+        args: list[str],
+        kubeconfig_path: Path,
+        timeout: float = 30,
+        deadline: float | None = None,
     ) -> AsyncCompletedProcess:
         """Run kubectl command with kubeconfig asynchronously.
 
@@ -120,6 +337,7 @@ class KubectlManager:
             args: Command arguments
             kubeconfig_path: Path to kubeconfig file
             timeout: Command timeout in seconds
+            deadline: Optional ``time.monotonic()`` deadline; the timeout is clamped to it
 
         Returns:
             AsyncCompletedProcess
@@ -127,22 +345,381 @@ class KubectlManager:
         Raises:
             KubectlCommandError: If command fails
         """
-        cmd = ["kubectl", "--kubeconfig", str(kubeconfig_path)] + args
-        logger.debug(f"Running kubectl command: {' '.join(cmd)}")
+        cmd = [self._kubectl, "--kubeconfig", str(kubeconfig_path)] + args
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Running kubectl command: {' '.join(cmd)}")
 
-        try:
-            result = await run_async(
-                cmd,
-                timeout=timeout,
-                check=False,
-                capture_output=True,
-            )
-            return result
+        key = str(kubeconfig_path)
+        slots = self._cluster_slots.get(key)
+        if slots is None:
+            slots = self._cluster_slots[key] = _ClusterSlots()
+        slots.users += 1
 
+        try:
+            async with slots.semaphore, self._kubectl_slots:
+                # Budget after queueing for a slot, so the wait counts against the deadline
+                timeout = self._budget(timeout, deadline)
+                result = await run_async(
+                    cmd,
+                    timeout=timeout,
+                    check=False,
+                    capture_output=True,
+                )
         except TimeoutError as e:
             raise KubectlCommandError(f"kubectl command timed out after {timeout} seconds") from e
         except FileNotFoundError as e:
             raise KubectlCommandError("kubectl CLI not found in PATH") from e
+        finally:
+            slots.users -= 1
+            if slots.users == 0 and self._cluster_slots.get(key) is slots:
+                del self._cluster_slots[key]
+
+        # The cluster went away since it was validated: make the next call re-run
+        # cluster-info so it reports ClusterNotFoundError instead of a kubectl failure
+        if result.returncode != 0 and _UNREACHABLE_RE.search(result.stderr):
+            for name in [
+                name
+                for name in self._validated
+                if self._get_kubeconfig_path(name) == kubeconfig_path
+            ]:
+                del self._validated[name]
+
+        return result
+
+    async def _get_proxy_port(
+        self, cluster_name: str, kubeconfig_path: Path, deadline: float | None = None
+    ) -> int | None:
+        """Get the local port of the cluster's kubectl proxy, starting it if needed.
+
+        Args:
+            cluster_name: Cluster name
+            kubeconfig_path: Path to kubeconfig file
+            deadline: Optional ``time.monotonic()`` deadline bounding proxy startup
+
+        Returns:
+            Proxy port, or None if the proxy could not be started
+
+        Raises:
+            KubectlCommandError: If the deadline passes before the proxy is started
+        """
+        entry = self._proxies.get(cluster_name)
+        if entry and entry[0].returncode is None:
+            return entry[1]
+
+        lock = self._proxy_locks.get(cluster_name)
+        if lock is None:
+            lock = self._proxy_locks[cluster_name] = asyncio.Lock()
+
+        async with lock:
+            # Another caller may have started it while we waited for the lock
+            entry = self._proxies.get(cluster_name)
+            if entry and entry[0].returncode is None:
+                return entry[1]
+
+            timeout = self._budget(10, deadline)
+
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    self._kubectl,
+                    "--kubeconfig",
+                    str(kubeconfig_path),
+                    "proxy",
+                    "--port=0",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+            except OSError as e:
+                logger.debug(f"Could not start kubectl proxy for '{cluster_name}': {e}")
+                return None
+
+            line = b""
+            if process.stdout is not None:
+                try:
+                    line = await asyncio.wait_for(process.stdout.readline(), timeout=timeout)
+                except TimeoutError:
+                    pass
+
+            match = _PROXY_PORT_RE.search(line)
+            if not match:
+                logger.debug(f"kubectl proxy for '{cluster_name}' did not report a port")
+                if process.returncode is None:
+                    process.terminate()
+                    await process.wait()
+                return None
+
+            port = int(match.group(1))
+            self._proxies[cluster_name] = (process, port)
+            if not self._proxy_atexit_registered:
+                atexit.register(self._kill_proxies)
+                self._proxy_atexit_registered = True
+            logger.debug(f"Started kubectl proxy for '{cluster_name}' on port {port}")
+            return port
+
+    async def _proxy_port_for(self, cluster_name: str, deadline: float | None = None) -> int | None:
+        """Get the kubectl proxy port for a cluster that has a saved kubeconfig.
+
+        Args:
+            cluster_name: Cluster name
+            deadline: Optional ``time.monotonic()`` deadline bounding proxy startup
+
+        Returns:
+            Local proxy port, or None if no proxy is available
+        """
+        kubeconfig_path = self._get_kubeconfig_path(cluster_name)
+        if not kubeconfig_path.exists():
+            return None
+        return await self._get_proxy_port(cluster_name, kubeconfig_path, deadline)
+
+    async def _proxy_get(
+        self,
+        cluster_name: str,
+        port: int,
+        path: str,
+        params: dict[str, str],
+        deadline: float | None = None,
+    ) -> tuple[int, bytes] | None:
+        """Issue a GET request through a cluster's kubectl proxy.
+
+        Args:
+            cluster_name: Cluster name
+            port: Local proxy port
+            path: API path (e.g. /api/v1/namespaces/default/pods)
+            params: Query parameters
+            deadline: Optional ``time.monotonic()`` deadline; the request timeout is clamped to it
+
+        Returns:
+            Tuple of (HTTP status, body), or None if the proxy could not be reached
+
+        Raises:
+            KubectlCommandError: If the deadline has already passed
+        """
+        timeout = self._budget(30, deadline)
+
+        import aiohttp
+
+        try:
+            if self._http is None or self._http.closed:
+                # Keep connections to the local proxies open between tool calls
+                self._http = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+                )
+            async with self._http.get(
+                f"http://127.0.0.1:{port}{path}",
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as resp:
+                return resp.status, await resp.read()
+        except TimeoutError:
+            # A slow API server (or a tight deadline) is no reason to restart the proxy
+            logger.debug(f"kubectl proxy request timed out for '{cluster_name}' after {timeout}s")
+            return None
+        except Exception as e:
+            logger.debug(f"kubectl proxy request failed for '{cluster_name}': {e}")
+            await self.stop_proxy(cluster_name)
+            return None
+
+    async def _proxy_logs(
+        self,
+        cluster_name: str,
+        pod_name: str,
+        namespace: str,
+        container: str | None,
+        tail_lines: int,
+        previous: bool,
+        deadline: float | None = None,
+    ) -> str | None:
+        """Fetch pod logs from the log subresource through the cluster's kubectl proxy.
+
+        Args:
+            cluster_name: Cluster name
+            pod_name: Pod name
+            namespace: Kubernetes namespace
+            container: Container name (optional)
+            tail_lines: Number of lines to retrieve
+            previous: Get logs from previous container instance
+            deadline: Optional ``time.monotonic()`` deadline bounding the request
+
+        Returns:
+            Log text, or None if the caller should fall back to kubectl
+
+        Raises:
+            ResourceNotFoundError: If pod not found
+        """
+        port = await self._proxy_port_for(cluster_name, deadline)
+        if port is None:
+            return None
+
+        params = {"tailLines": str(tail_lines)}
+        if container:
+            params["container"] = container
+        if previous:
+            params["previous"] = "true"
+
+        response = await self._proxy_get(
+            cluster_name,
+            port,
+            f"/api/v1/namespaces/{namespace}/pods/{pod_name}/log",
+            params,
+            deadline,
+        )
+        if response is None:
+            return None
+        status, body = response
+        if status == 404:
+            raise ResourceNotFoundError(
+                f"Pod '{pod_name}' not found in cluster '{cluster_name}', namespace '{namespace}'"
+            )
+        if status != 200:
+            # e.g. a container name is required; let kubectl report the error
+            return None
+        return body.decode("utf-8", errors="replace")
+
+    async def _proxy_list(
+        self,
+        cluster_name: str,
+        resource_type: str,
+        namespace: str,
+        label_selector: str | None,
+        deadline: float | None = None,
+    ) -> dict | None:
+        """List resources through the cluster's kubectl proxy.
+
+        Args:
+            cluster_name: Cluster name
+            resource_type: Resource type (pods, services, deployments, etc.)
+            namespace: Kubernetes namespace
+            label_selector: Optional label selector
+            deadline: Optional ``time.monotonic()`` deadline bounding every page request
+
+        Returns:
+            Parsed list response, or None if the caller should fall back to kubectl
+        """
+        spec = _PROXY_PATHS.get(resource_type.lower())
+        if spec is None:
+            return None
+
+        port = await self._proxy_port_for(cluster_name, deadline)
+        if port is None:
+            return None
+
+        api_path, namespaced = spec
+        if namespaced:
+            path = f"{api_path}/namespaces/{namespace}/{resource_type.lower()}"
+        else:
+            path = f"{api_path}/{resource_type.lower()}"
+        # Page through the list like kubectl's --chunk-size does, so the API server
+        # never has to build a single response holding every object
+        params = {"limit": str(_PROXY_PAGE_SIZE)}
+        if label_selector:
+            params["labelSelector"] = label_selector
+
+        data: dict | None = None
+        while True:
+            response = await self._proxy_get(cluster_name, port, path, params, deadline)
+            if response is None or response[0] != 200:
+                return None
+            try:
+                page: dict = json_compat.loads(response[1])
+            except json.JSONDecodeError:
+                return None
+            items = page.get("items") or []
+            if data is None:
+                data = page
+                data["items"] = items
+            else:
+                data["items"].extend(items)
+            token = page.get("metadata", {}).get("continue")
+            if not token:
+                break
+            params["continue"] = token
+
+        # List responses omit per-item kind/apiVersion; restore them to match kubectl output
+        kind = data.get("kind", "").removesuffix("List")
+        api_version = data.get("apiVersion")
+        for item in data.get("items", []):
+            item.setdefault("kind", kind)
+            item.setdefault("apiVersion", api_version)
+        return data
+
+    async def _proxy_list_many(
+        self,
+        cluster_name: str,
+        resource_types: list[str],
+        namespace: str,
+        label_selector: str | None,
+        deadline: float | None = None,
+    ) -> list[dict] | None:
+        """List several resource types concurrently through the cluster's kubectl proxy.
+
+        Args:
+            cluster_name: Cluster name
+            resource_types: Resource types to list
+            namespace: Kubernetes namespace
+            label_selector: Optional label selector
+            deadline: Optional ``time.monotonic()`` deadline bounding every request
+
+        Returns:
+            Items of every type in request order, or None if any type cannot be served
+            through the proxy (the caller then falls back to a single kubectl call)
+        """
+        pages = await asyncio.gather(
+            *(
+                self._proxy_list(
+                    cluster_name, resource_type.strip(), namespace, label_selector, deadline
+                )
+                for resource_type in resource_types
+            )
+        )
+        items: list[dict] = []
+        for page in pages:
+            if page is None:
+                return None
+            items.extend(page.get("items", []))
+        return items
+
+    async def stop_proxy(self, cluster_name: str) -> None:
+        """Stop the kubectl proxy for a cluster, if one is running.
+
+        Args:
+            cluster_name: Cluster name
+        """
+        entry = self._proxies.pop(cluster_name, None)
+        if entry is None:
+            return
+        process = entry[0]
+        if process.returncode is None:
+            process.terminate()
+            await process.wait()
+
+    async def forget_cluster(self, cluster_name: str) -> None:
+        """Drop cached state for a cluster that is being removed.
+
+        Stops its kubectl proxy and forgets its validation, proxy lock and kubectl slots.
+
+        Args:
+            cluster_name: Cluster name
+        """
+        self._validated.pop(cluster_name, None)
+        self._proxy_locks.pop(cluster_name, None)
+        self._cluster_slots.pop(str(self._get_kubeconfig_path(cluster_name)), None)
+        await self.stop_proxy(cluster_name)
+
+    async def close(self) -> None:
+        """Stop all kubectl proxies and close the shared HTTP session."""
+        for cluster_name in list(self._proxies):
+            await self.stop_proxy(cluster_name)
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
+    def _kill_proxies(self) -> None:
+        """Terminate any proxies still running at interpreter exit."""
+        for process, _ in self._proxies.values():
+            if process.returncode is None:
+                try:
+                    os.kill(process.pid, signal.SIGTERM)
+                except OSError:
+                    pass
 
     async def get_resources(
         self,
@@ -150,6 +727,7 @@ class KubectlManager:
         resource_type: str,
         namespace: str = "default",
         label_selector: str | None = None,
+        deadline: float | None = None,
     ) -> dict:
         """Get Kubernetes resources by type asynchronously.
 
@@ -158,6 +736,7 @@ class KubectlManager:
             resource_type: Resource type (pods, services, deployments, etc.)
             namespace: Kubernetes namespace (default: "default")
             label_selector: Optional label selector (e.g., "app=nginx")
+            deadline: Optional ``time.monotonic()`` deadline bounding every kubectl call
 
         Returns:
             Dict with resource information
@@ -167,24 +746,39 @@ class KubectlManager:
             ClusterNotFoundError: If cluster not accessible
             KubectlCommandError: If kubectl command fails
         """
-        kubeconfig_path = await self._validate_kubeconfig(cluster_name)
+        data = None
+        if self._use_proxy:
+            if "," in resource_type:
+                items = await self._proxy_list_many(
+                    cluster_name, resource_type.split(","), namespace, label_selector, deadline
+                )
+                if items is not None:
+                    data = {"items": items}
+            else:
+                data = await self._proxy_list(
+                    cluster_name, resource_type, namespace, label_selector, deadline
+                )
 
-        # Build command
-        args = ["get", resource_type, "-n", namespace, "-o", "json"]
-        if label_selector:
-            args.extend(["-l", label_selector])
+        if data is None:
+            kubeconfig_path = await self._validate_kubeconfig(cluster_name, deadline)
 
-        result = await self._run_kubectl(args, kubeconfig_path)
+            # Build command
+            args = ["get", resource_type, "-n", namespace, "-o", "json"]
+            if label_selector:
+                args.extend(["-l", label_selector])
 
-        if result.returncode != 0:
-            error_msg = result.stderr or result.stdout
-            raise KubectlCommandError(
-                f"Failed to get {resource_type} in cluster '{cluster_name}': {error_msg}"
-            )
+            result = await self._run_kubectl(args, kubeconfig_path, deadline=deadline)
+
+            if result.returncode != 0:
+                error_msg = result.stderr or result.stdout
+                raise KubectlCommandError(
+                    f"Failed to get {resource_type} in cluster '{cluster_name}': {error_msg}"
+                )
 
         # Parse JSON output
         try:
-            data = json.loads(result.stdout)
+            if data is None:
+                data = json_compat.loads(result.stdout_bytes)
             items = data.get("items", [])
 
             logger.info(
@@ -204,11 +798,155 @@ class KubectlManager:
         except json.JSONDecodeError as e:
             raise KubectlCommandError(f"Failed to parse kubectl output as JSON: {e}") from e
 
+    async def get_resources_multi(
+        self,
+        cluster_name: str,
+        resource_types: list[str],
+        namespace: str = "default",
+        label_selector: str | None = None,
+        deadline: float | None = None,
+    ) -> dict:
+        """Get several Kubernetes resource types with a single kubectl call.
+
+        Uses kubectl's comma-separated type syntax (e.g. ``pods,services``) so a
+        dashboard-style query costs one subprocess and one JSON parse instead of
+        one per type. With the kubectl proxy enabled, the types are instead listed
+        concurrently over HTTP, falling back to the single kubectl call if any of
+        them cannot be served that way.
+
+        One bad type fails the whole combined call, so on failure each type is
+        listed concurrently on its own: the types that succeed are still returned
+        and the failures are reported per type under ``errors``.
+
+        Args:
+            cluster_name: Cluster name
+            resource_types: Resource types to fetch (e.g., ["pods", "services"])
+            namespace: Kubernetes namespace (default: "default")
+            label_selector: Optional label selector (e.g., "app=nginx")
+            deadline: Optional ``time.monotonic()`` deadline bounding every kubectl call
+
+        Returns:
+            Dict with resource information, with resources grouped by item kind and
+            an ``errors`` map of resource type -> error for types that failed
+
+        Raises:
+            ValueError: If no resource types are given
+            KubeconfigNotFoundError: If kubeconfig not found
+            ClusterNotFoundError: If cluster not accessible
+            KubectlCommandError: If kubectl command fails for every resource type
+        """
+        if not resource_types:
+            raise ValueError("At least one resource type is required")
+
+        type_list = ",".join(resource_types)
+        items: list[dict] | None = None
+        errors: dict[str, str] = {}
+
+        if self._use_proxy:
+            items = await self._proxy_list_many(
+                cluster_name, resource_types, namespace, label_selector, deadline
+            )
+
+        if items is None:
+            kubeconfig_path = await self._validate_kubeconfig(cluster_name, deadline)
+
+            # Build command
+            args = ["get", type_list, "-n", namespace, "-o", "json"]
+            if label_selector:
+                args.extend(["-l", label_selector])
+
+            result = await self._run_kubectl(args, kubeconfig_path, deadline=deadline)
+
+            if result.returncode != 0:
+                if len(resource_types) == 1:
+                    error_msg = result.stderr or result.stdout
+                    raise KubectlCommandError(
+                        f"Failed to get {type_list} in cluster '{cluster_name}': {error_msg}"
+                    )
+                items, errors = await self._get_each_type(
+                    cluster_name, resource_types, namespace, label_selector, deadline
+                )
+            else:
+                # Parse JSON output once
+                try:
+                    data = json_compat.loads(result.stdout_bytes)
+                except json.JSONDecodeError as e:
+                    raise KubectlCommandError(f"Failed to parse kubectl output as JSON: {e}") from e
+                items = data.get("items", [])
+
+        # Partition by kind
+        resources: dict[str, list[dict]] = {}
+        for item in items:
+            resources.setdefault(item.get("kind", "Unknown"), []).append(item)
+
+        logger.info(
+            f"Found {len(items)} resources ({type_list}) in cluster '{cluster_name}', "
+            f"namespace '{namespace}'"
+        )
+
+        return {
+            "cluster_name": cluster_name,
+            "resource_types": resource_types,
+            "namespace": namespace,
+            "label_selector": label_selector,
+            "resources": resources,
+            "count": len(items),
+            "errors": errors,
+        }
+
+    async def _get_each_type(
+        self,
+        cluster_name: str,
+        resource_types: list[str],
+        namespace: str,
+        label_selector: str | None,
+        deadline: float | None,
+    ) -> tuple[list[dict], dict[str, str]]:
+        """List each resource type with its own concurrent kubectl call.
+
+        Args:
+            cluster_name: Cluster name
+            resource_types: Resource types to list
+            namespace: Kubernetes namespace
+            label_selector: Optional label selector
+            deadline: Optional ``time.monotonic()`` deadline bounding every kubectl call
+
+        Returns:
+            (items of the types that succeeded in request order, resource type -> error)
+
+        Raises:
+            KubectlCommandError: If every resource type fails
+        """
+        results = await asyncio.gather(
+            *(
+                self.get_resources(cluster_name, resource_type, namespace, label_selector, deadline)
+                for resource_type in resource_types
+            ),
+            return_exceptions=True,
+        )
+        items: list[dict] = []
+        errors: dict[str, str] = {}
+        for resource_type, result in zip(resource_types, results, strict=True):
+            if isinstance(result, Exception):
+                errors[resource_type] = str(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                items.extend(result["resources"])
+
+        if len(errors) == len(resource_types):
+            raise KubectlCommandError(
+                f"Failed to get {','.join(resource_types)} in cluster '{cluster_name}': "
+                + "; ".join(errors.values())
+            )
+        return items, errors
+
     async def apply_manifest(
         self,
         cluster_name: str,
         manifest: str,
         namespace: str = "default",
+        deadline: float | None = None,
     ) -> dict:
         """Apply Kubernetes manifest to cluster asynchronously.
 
@@ -216,6 +954,7 @@ class KubectlManager:
             cluster_name: Cluster name
             manifest: YAML/JSON manifest content
             namespace: Kubernetes namespace (default: "default")
+            deadline: Optional ``time.monotonic()`` deadline bounding every kubectl call
 
         Returns:
             Dict with apply result
@@ -226,14 +965,18 @@ class KubectlManager:
             InvalidManifestError: If manifest is invalid
             KubectlCommandError: If kubectl command fails
         """
-        kubeconfig_path = await self._validate_kubeconfig(cluster_name)
+        # PyYAML is only needed here, so import it lazily to keep module import cheap
+        import yaml
 
-        # Validate manifest is valid YAML
+        # Validate manifest is valid YAML before touching the cluster, so malformed
+        # input fails without a kubectl call
         try:
-            yaml.safe_load(manifest)
+            _check_manifest_yaml(manifest)
         except yaml.YAMLError as e:
             raise InvalidManifestError(f"Invalid YAML manifest: {e}") from e
 
+        kubeconfig_path = await self._validate_kubeconfig(cluster_name, deadline)
+
         # Write manifest to temporary file
         temp_file = None
         try:
@@ -243,7 +986,7 @@ class KubectlManager:
 
             # Apply manifest
             args = ["apply", "-f", temp_file, "-n", namespace]
-            result = await self._run_kubectl(args, kubeconfig_path, timeout=60)
+            result = await self._run_kubectl(args, kubeconfig_path, timeout=60, deadline=deadline)
 
             if result.returncode != 0:
                 error_msg = result.stderr or result.stdout
@@ -252,8 +995,11 @@ class KubectlManager:
                 )
 
             # Parse output to extract resource names
-            output_lines = result.stdout.strip().split("\n")
-            resources = [line.strip() for line in output_lines if line.strip()]
+            resources = []
+            for line in result.stdout.splitlines():
+                line = line.strip()
+                if line:
+                    resources.append(line)
 
             logger.info(
                 f"Applied manifest to cluster '{cluster_name}', namespace '{namespace}': "
@@ -280,6 +1026,7 @@ class KubectlManager:
         name: str,
         namespace: str = "default",
         force: bool = False,
+        deadline: float | None = None,
     ) -> dict:
         """Delete a Kubernetes resource asynchronously.
 
@@ -289,6 +1036,7 @@ class KubectlManager:
             name: Resource name
             namespace: Kubernetes namespace (default: "default")
             force: Force deletion with zero grace period
+            deadline: Optional ``time.monotonic()`` deadline bounding every kubectl call
 
         Returns:
             Dict with deletion status
@@ -298,18 +1046,18 @@ class KubectlManager:
             ClusterNotFoundError: If cluster not accessible
             KubectlCommandError: If kubectl command fails
         """
-        kubeconfig_path = await self._validate_kubeconfig(cluster_name)
+        kubeconfig_path = await self._validate_kubeconfig(cluster_name, deadline)
 
         # Build command
         args = ["delete", resource_type, name, "-n", namespace]
         if force:
             args.extend(["--grace-period=0", "--force"])
 
-        result = await self._run_kubectl(args, kubeconfig_path, timeout=60)
+        result = await self._run_kubectl(args, kubeconfig_path, timeout=60, deadline=deadline)
 
         # Resource not found is not an error (idempotent delete)
         if result.returncode != 0:
-            if "NotFound" in result.stderr or "not found" in result.stderr.lower():
+            if _NOT_FOUND_RE.search(result.stderr):
                 logger.info(
                     f"Resource {resource_type}/{name} not found in cluster '{cluster_name}', "
                     f"namespace '{namespace}' (already deleted)"
@@ -351,6 +1099,7 @@ class KubectlManager:
         container: str | None = None,
         tail_lines: int = 100,
         previous: bool = False,
+        deadline: float | None = None,
     ) -> dict:
         """Get logs from a pod asynchronously.
 
@@ -361,6 +1110,7 @@ class KubectlManager:
             container: Container name (optional, for multi-container pods)
             tail_lines: Number of lines to retrieve (default: 100)
             previous: Get logs from previous container instance
+            deadline: Optional ``time.monotonic()`` deadline bounding every kubectl call
 
         Returns:
             Dict with pod logs
@@ -371,32 +1121,45 @@ class KubectlManager:
             ResourceNotFoundError: If pod not found
             KubectlCommandError: If kubectl command fails
         """
-        kubeconfig_path = await self._validate_kubeconfig(cluster_name)
+        logs = None
+        if self._use_proxy:
+            logs = await self._proxy_logs(
+                cluster_name, pod_name, namespace, container, tail_lines, previous, deadline
+            )
 
-        # Build command
-        args = ["logs", pod_name, "-n", namespace, f"--tail={tail_lines}"]
-        if container:
-            args.extend(["-c", container])
-        if previous:
-            args.append("--previous")
+        if logs is None:
+            kubeconfig_path = await self._validate_kubeconfig(cluster_name, deadline)
 
-        result = await self._run_kubectl(args, kubeconfig_path, timeout=30)
+            # Build command
+            args = ["logs", pod_name, "-n", namespace, f"--tail={tail_lines}"]
+            if container:
+                args.extend(["-c", container])
+            if previous:
+                args.append("--previous")
 
-        if result.returncode != 0:
-            error_msg = result.stderr or result.stdout
-            if "NotFound" in error_msg or "not found" in error_msg.lower():
-                raise ResourceNotFoundError(
-                    f"Pod '{pod_name}' not found in cluster '{cluster_name}', namespace '{namespace}'"
+            result = await self._run_kubectl(args, kubeconfig_path, timeout=30, deadline=deadline)
+
+            if result.returncode != 0:
+                error_msg = result.stderr or result.stdout
+                if _NOT_FOUND_RE.search(error_msg):
+                    raise ResourceNotFoundError(
+                        f"Pod '{pod_name}' not found in cluster '{cluster_name}', "
+                        f"namespace '{namespace}'"
+                    )
+                raise KubectlCommandError(
+                    f"Failed to get logs for pod '{pod_name}' in cluster '{cluster_name}': "
+                    f"{error_msg}"
                 )
-            raise KubectlCommandError(
-                f"Failed to get logs for pod '{pod_name}' in cluster '{cluster_name}': {error_msg}"
-            )
 
-        logs = result.stdout
-        log_lines = logs.split("\n") if logs.strip() else []
+            logs = result.stdout
+
+        # Count newlines instead of materializing a list of every log line
+        line_count = 0
+        if logs.strip():
+            line_count = logs.count("\n") + (0 if logs.endswith("\n") else 1)
 
         logger.info(
-            f"Retrieved {len(log_lines)} lines of logs from pod '{pod_name}' "
+            f"Retrieved {line_count} lines of logs from pod '{pod_name}' "
             f"in cluster '{cluster_name}', namespace '{namespace}'"
         )
 
@@ -406,15 +1169,107 @@ class KubectlManager:
             "namespace": namespace,
             "container": container,
             "logs": logs,
-            "lines": len(log_lines),
+            "lines": line_count,
         }
 
+    async def stream_logs(
+        self,
+        cluster_name: str,
+        pod_name: str,
+        namespace: str = "default",
+        container: str | None = None,
+        tail_lines: int = 100,
+    ) -> AsyncIterator[str]:
+        """Stream logs from a pod, following new output as it is written.
+
+        Opens a single ``kubectl logs --follow`` process and yields lines as they
+        arrive, instead of re-running ``get_logs`` for every poll. The process is
+        terminated when the caller stops iterating or cancels the task.
+
+        The follow process runs outside the per-cluster and global kubectl
+        concurrency limits: it lives for as long as the caller keeps reading, so
+        holding a slot would starve short-lived commands for the whole stream.
+
+        Args:
+            cluster_name: Cluster name
+            pod_name: Pod name
+            namespace: Kubernetes namespace (default: "default")
+            container: Container name (optional, for multi-container pods)
+            tail_lines: Number of existing lines to emit before following (default: 100)
+
+        Yields:
+            Log lines without trailing newlines
+
+        Raises:
+            KubeconfigNotFoundError: If kubeconfig not found
+            ClusterNotFoundError: If cluster not accessible
+            ResourceNotFoundError: If pod not found
+            KubectlCommandError: If kubectl command fails
+        """
+        kubeconfig_path = await self._validate_kubeconfig(cluster_name)
+
+        # Build command
+        cmd = [
+            self._kubectl,
+            "--kubeconfig",
+            str(kubeconfig_path),
+            "logs",
+            pod_name,
+            "-n",
+            namespace,
+            "--follow",
+            f"--tail={tail_lines}",
+        ]
+        if container:
+            cmd.extend(["-c", container])
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Streaming kubectl command: {' '.join(cmd)}")
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=_STREAM_LINE_LIMIT,
+            )
+        except FileNotFoundError as e:
+            raise KubectlCommandError("kubectl CLI not found in PATH") from e
+
+        # Drain stderr alongside stdout so a chatty kubectl cannot fill the pipe and stall
+        assert process.stdout is not None and process.stderr is not None
+        stderr_task = asyncio.create_task(_read_tail(process.stderr, _STREAM_STDERR_TAIL))
+        try:
+            async for line in _iter_lines(process.stdout):
+                yield line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+            await process.wait()
+            if process.returncode != 0:
+                error_msg = (await stderr_task).decode("utf-8", errors="replace")
+                if _NOT_FOUND_RE.search(error_msg):
+                    raise ResourceNotFoundError(
+                        f"Pod '{pod_name}' not found in cluster '{cluster_name}', "
+                        f"namespace '{namespace}'"
+                    )
+                raise KubectlCommandError(
+                    f"Failed to stream logs for pod '{pod_name}' in cluster "
+                    f"'{cluster_name}': {error_msg}"
+                )
+
+        finally:
+            # Caller stopped iterating or was cancelled - stop following
+            if process.returncode is None:
+                process.terminate()
+                await process.wait()
+            stderr_task.cancel()
+
     async def describe_resource(
         self,
         cluster_name: str,
         resource_type: str,
         name: str,
         namespace: str = "default",
+        deadline: float | None = None,
     ) -> dict:
         """Describe a Kubernetes resource asynchronously.
 
@@ -423,6 +1278,7 @@ class KubectlManager:
             resource_type: Resource type (pod, service, deployment, etc.)
             name: Resource name
             namespace: Kubernetes namespace (default: "default")
+            deadline: Optional ``time.monotonic()`` deadline bounding every kubectl call
 
         Returns:
             Dict with resource description
@@ -433,16 +1289,16 @@ class KubectlManager:
             ResourceNotFoundError: If resource not found
             KubectlCommandError: If kubectl command fails
         """
-        kubeconfig_path = await self._validate_kubeconfig(cluster_name)
+        kubeconfig_path = await self._validate_kubeconfig(cluster_name, deadline)
 
         # Build command
         args = ["describe", resource_type, name, "-n", namespace]
 
-        result = await self._run_kubectl(args, kubeconfig_path, timeout=30)
+        result = await self._run_kubectl(args, kubeconfig_path, timeout=30, deadline=deadline)
 
         if result.returncode != 0:
             error_msg = result.stderr or result.stdout
-            if "NotFound" in error_msg or "not found" in error_msg.lower():
+            if _NOT_FOUND_RE.search(error_msg):
                 raise ResourceNotFoundError(
                     f"Resource {resource_type}/{name} not found in cluster '{cluster_name}', "
                     f"namespace '{namespace}'"
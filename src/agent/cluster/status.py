@@ -2,9 +2,18 @@
 
 import json
 import logging
+import re
+import shutil
 import subprocess
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from agent.utils import json_compat
 from agent.utils.errors import ClusterNotFoundError, KindCommandError
 
 if TYPE_CHECKING:
@@ -12,6 +21,68 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Project only the node fields get_node_status needs: name, Ready status, kubelet
+# version and the label map (tab-separated, one node per line)
+_NODE_JSONPATH = (
+    "{range .items[*]}"
+    '{.metadata.name}{"\\t"}'
+    '{.status.conditions[?(@.type=="Ready")].status}{"\\t"}'
+    '{.status.nodeInfo.kubeletVersion}{"\\t"}'
+    '{.metadata.labels}{"\\n"}'
+    "{end}"
+)
+
+# Namespace/name pairs for every deployment, one per line
+_DEPLOYMENT_JSONPATH = '{range .items[*]}{.metadata.namespace}{"\\t"}{.metadata.name}{"\\n"}{end}'
+
+# Namespaces addon deployments are looked for in
+_ADDON_NAMESPACES = ("kube-system", "ingress-nginx")
+
+# One `kubectl top nodes --no-headers` row: the first five whitespace-separated columns.
+# Separators exclude newlines so a short row can't borrow fields from the next one.
+_TOP_LINE_RE = re.compile(
+    rb"^[ \t]*(\S+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)", re.MULTILINE
+)
+
+# Either label marks a control-plane node (master is the pre-1.20 name)
+_CONTROL_PLANE_LABELS = frozenset(
+    {"node-role.kubernetes.io/control-plane", "node-role.kubernetes.io/master"}
+)
+
+# Node, metrics and addon probes are independent subprocesses; this is enough
+# workers for one status check to run all of them side by side
+_MAX_STATUS_WORKERS = 5
+
+# How long probe results are reused, so status-then-health doesn't re-run kubectl
+_STATUS_CACHE_TTL = 2.0
+
+
+@dataclass(slots=True, frozen=True)
+class NodeStatus:
+    """Compact status of a single node.
+
+    Attributes:
+        name: Node name
+        role: "control-plane" or "worker"
+        ready: Whether the node's Ready condition is True
+        version: Kubelet version
+    """
+
+    name: str
+    role: str
+    ready: bool
+    version: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the dict shape returned by the status tools."""
+        return {
+            "name": self.name,
+            "role": self.role,
+            "ready": self.ready,
+            "version": self.version,
+            "status": "Ready" if self.ready else "NotReady",
+        }
+
 
 class ClusterStatus:
     """Cluster status and health checking operations."""
@@ -23,6 +94,71 @@ class ClusterStatus:
             config: Optional AgentConfig for path resolution
         """
         self.config = config
+        self._executor = ThreadPoolExecutor(
+            max_workers=_MAX_STATUS_WORKERS, thread_name_prefix="cluster-status"
+        )
+        self._cache: dict[tuple[str, str], tuple[float, Any]] = {}
+        # Resolve binaries once: a missing helm/kubectl is skipped without a spawn
+        # attempt, and present ones are exec'd by absolute path
+        self._kubectl = shutil.which("kubectl")
+        self._helm = shutil.which("helm")
+        self._cache_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Release the probe worker threads.
+
+        Probes already running are left to finish in the background.
+        """
+        self._executor.shutdown(wait=False)
+
+    def _cached(self, key: tuple[str, str], fn: Callable[..., Any], *args: Any) -> Any:
+        """Return a recent result for key, or call fn and remember its result.
+
+        Empty results (``[]``, ``{}``, ``None``) are how the probes report failure,
+        so they are never cached and evict any previous entry.
+
+        Args:
+            key: (cluster name, probe name) cache key
+            fn: Probe to call on a cache miss
+            *args: Arguments for fn
+
+        Returns:
+            The probe result
+        """
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit and time.monotonic() - hit[0] < _STATUS_CACHE_TTL:
+                return hit[1]
+
+        value = fn(*args)
+
+        with self._cache_lock:
+            if value:
+                self._cache[key] = (time.monotonic(), value)
+            else:
+                self._cache.pop(key, None)
+        return value
+
+    def _cluster_args(self, name: str, context_flag: str = "--context") -> list[str]:
+        """Build the command-line arguments that select a cluster.
+
+        Points straight at the cluster's saved kubeconfig when there is one, which
+        spares kubectl/helm from loading and merging the user's default kubeconfigs.
+        Otherwise falls back to the kind context in the default kubeconfig.
+
+        Args:
+            name: Cluster name
+            context_flag: Context flag for the tool ("--context" for kubectl,
+                "--kube-context" for helm)
+
+        Returns:
+            Arguments to splice into the command
+        """
+        if self.config is not None:
+            kubeconfig = self.config.get_kubeconfig_path(name)
+            if kubeconfig.is_file():
+                return ["--kubeconfig", str(kubeconfig)]
+        return [context_flag, f"kind-{name}"]
 
     def get_cluster_status(self, name: str) -> dict[str, Any]:
         """Get comprehensive cluster status.
@@ -37,35 +173,46 @@ class ClusterStatus:
             ClusterNotFoundError: If cluster doesn't exist
         """
         try:
-            nodes = self.get_node_status(name)
-            if not nodes:
+            # Fan out the independent probes; detect_addons runs its own probes on
+            # the same pool, so it is called inline to avoid nested waits on workers
+            nodes_future = self._executor.submit(
+                self._cached, (name, "nodes"), self._summarize_nodes, name
+            )
+            usage_future = self._executor.submit(
+                self._cached, (name, "usage"), self.get_resource_usage, name
+            )
+
+            # Detect installed addons (requires Helm)
+            addons: dict[str, Any] = {}
+            try:
+                addons = self._cached((name, "addons"), self.detect_addons, name)
+            except Exception as e:
+                logger.debug(f"Could not detect addons: {e}")
+                # Don't fail status check if addon detection fails
+
+            summary = nodes_future.result()
+            if not summary:
                 raise ClusterNotFoundError(f"Cluster '{name}' not found or not accessible")
+            nodes, ready_nodes = summary
 
             # Get basic cluster info
             status: dict[str, Any] = {
                 "cluster_name": name,
                 "status": "running" if nodes else "unknown",
-                "nodes": nodes,
+                "nodes": [node.to_dict() for node in nodes],
                 "total_nodes": len(nodes),
-                "ready_nodes": sum(1 for n in nodes if n.get("ready")),
+                "ready_nodes": ready_nodes,
             }
 
-            # Try to get resource usage (requires metrics-server)
+            # Resource usage requires metrics-server
             try:
-                resource_usage = self.get_resource_usage(name)
-                status["resource_usage"] = resource_usage
+                status["resource_usage"] = usage_future.result()
             except Exception as e:
                 logger.debug(f"Could not get resource usage: {e}")
                 status["resource_usage"] = None
 
-            # Detect installed addons (requires Helm)
-            try:
-                addons = self.detect_addons(name)
-                if addons:
-                    status["addons"] = addons
-            except Exception as e:
-                logger.debug(f"Could not detect addons: {e}")
-                # Don't fail status check if addon detection fails
+            if addons:
+                status["addons"] = addons
 
             return status
 
@@ -81,68 +228,80 @@ class ClusterStatus:
         Returns:
             List of node status dicts
         """
-        context = f"kind-{name}"
+        summary = self._summarize_nodes(name)
+        return [node.to_dict() for node in summary[0]] if summary else []
+
+    def _summarize_nodes(self, name: str) -> tuple[list[NodeStatus], int] | None:
+        """Get node statuses and the ready count in a single pass.
+
+        Args:
+            name: Cluster name
+
+        Returns:
+            (nodes, ready node count), or None if no nodes could be listed
+        """
+        if self._kubectl is None:
+            return None
+
+        target = self._cluster_args(name)
 
         try:
             result = subprocess.run(
                 [
-                    "kubectl",
+                    self._kubectl,
                     "get",
                     "nodes",
-                    "--context",
-                    context,
+                    *target,
                     "-o",
-                    "json",
+                    f"jsonpath={_NODE_JSONPATH}",
                 ],
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
 
             if result.returncode != 0:
-                logger.warning(f"Failed to get nodes: {result.stderr}")
-                return []
+                logger.warning(f"Failed to get nodes: {result.stderr.decode('utf-8', 'replace')}")
+                return None
 
-            data = json.loads(result.stdout)
             nodes = []
+            ready_count = 0
 
-            for item in data.get("items", []):
-                node_name = item.get("metadata", {}).get("name", "unknown")
-                status = item.get("status", {})
+            for line in result.stdout.splitlines():
+                fields = line.split(b"\t")
+                if len(fields) < 4:
+                    continue
+                node_name, ready_status, k8s_version, labels_json = fields[:4]
 
                 # Check if node is ready
-                ready = False
-                for condition in status.get("conditions", []):
-                    if condition.get("type") == "Ready":
-                        ready = condition.get("status") == "True"
-                        break
-
-                # Get node role
-                labels = item.get("metadata", {}).get("labels", {})
-                role = "worker"
-                if "node-role.kubernetes.io/control-plane" in labels:
-                    role = "control-plane"
-                elif "node-role.kubernetes.io/master" in labels:
-                    role = "control-plane"
-
-                # Get version
-                k8s_version = status.get("nodeInfo", {}).get("kubeletVersion", "unknown")
+                ready = ready_status == b"True"
+                ready_count += ready
+
+                # Get node role (role labels carry empty values, so check key presence).
+                # Parse the map rather than matching its text, whose exact formatting
+                # is up to the kubectl version.
+                labels: dict[str, str] = {}
+                if labels_json.strip():
+                    try:
+                        labels = json_compat.loads(labels_json)
+                    except json.JSONDecodeError:
+                        logger.debug(f"Unparseable labels for node '{node_name.decode()}'")
+                is_control_plane = not _CONTROL_PLANE_LABELS.isdisjoint(labels)
+                role = "control-plane" if is_control_plane else "worker"
 
                 nodes.append(
-                    {
-                        "name": node_name,
-                        "role": role,
-                        "ready": ready,
-                        "version": k8s_version,
-                        "status": "Ready" if ready else "NotReady",
-                    }
+                    NodeStatus(
+                        name=node_name.decode() or "unknown",
+                        role=role,
+                        ready=ready,
+                        version=k8s_version.decode() or "unknown",
+                    )
                 )
 
-            return nodes
+            return (nodes, ready_count) if nodes else None
 
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError) as e:
+        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
             logger.warning(f"Error getting node status: {e}")
-            return []
+            return None
 
     def get_resource_usage(self, name: str) -> dict[str, Any] | None:
         """Get resource usage for cluster (requires metrics-server).
@@ -153,179 +312,282 @@ class ClusterStatus:
         Returns:
             Dict with resource usage or None if metrics not available
         """
-        context = f"kind-{name}"
+        if self._kubectl is None:
+            return None
+
+        target = self._cluster_args(name)
 
         try:
             result = subprocess.run(
                 [
-                    "kubectl",
+                    self._kubectl,
                     "top",
                     "nodes",
-                    "--context",
-                    context,
+                    *target,
                     "--no-headers",
                 ],
                 capture_output=True,
-                text=True,
                 timeout=10,
             )
 
             if result.returncode != 0:
                 return None
 
-            # Parse output
+            # Parse output in one scan of the buffer
             # Format: NAME   CPU(cores)   CPU%   MEMORY(bytes)   MEMORY%
-            lines = result.stdout.strip().split("\n")
-            nodes = []
-
-            for line in lines:
-                parts = line.split()
-                if len(parts) >= 5:
-                    nodes.append(
-                        {
-                            "name": parts[0],
-                            "cpu_cores": parts[1],
-                            "cpu_percent": parts[2],
-                            "memory": parts[3],
-                            "memory_percent": parts[4],
-                        }
-                    )
+            nodes = [
+                {
+                    "name": m[1].decode(),
+                    "cpu_cores": m[2].decode(),
+                    "cpu_percent": m[3].decode(),
+                    "memory": m[4].decode(),
+                    "memory_percent": m[5].decode(),
+                }
+                for m in _TOP_LINE_RE.finditer(result.stdout)
+            ]
 
             return {"nodes": nodes, "available": True}
 
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return None
 
-    def detect_addons(self, name: str) -> dict[str, Any]:
-        """Detect installed addons via Helm or kubectl.
-
-        Checks both Helm releases and kubectl deployments to detect addons
-        regardless of installation method.
+    def _list_helm_releases(self, target: list[str]) -> list[dict[str, Any]]:
+        """List Helm releases in kube-system.
 
         Args:
-            name: Cluster name
+            target: Arguments selecting the cluster (see _cluster_args)
 
         Returns:
-            Dict mapping addon names to their status
+            List of release dicts (empty if Helm is unavailable)
         """
-        addons = {}
-        context = f"kind-{name}"
+        if self._helm is None:
+            return []
 
-        # Method 1: Check Helm releases (for addons installed via create_cluster)
-        # Use --kube-context for consistency with kubectl
         try:
             result = subprocess.run(
                 [
-                    "helm",
+                    self._helm,
                     "list",
                     "--namespace",
                     "kube-system",
-                    "--kube-context",
-                    context,
+                    *target,
                     "-o",
                     "json",
                 ],
                 capture_output=True,
-                text=True,
                 timeout=5,
             )
 
             if result.returncode == 0:
-                releases = json.loads(result.stdout)
-                helm_addon_map = {
-                    "ingress-nginx": ["ingress-nginx", "nginx-ingress"],
-                    "metrics-server": ["metrics-server"],
-                }
-
-                for canonical_name, release_names in helm_addon_map.items():
-                    found = next((r for r in releases if r.get("name") in release_names), None)
-                    if found:
-                        addons[canonical_name] = {
-                            "installed": True,
-                            "method": "helm",
-                            "version": found.get("app_version", "unknown"),
-                            "chart": found.get("chart", "unknown"),
-                        }
+                releases: list[dict[str, Any]] = json_compat.loads(result.stdout)
+                return releases
 
         except (FileNotFoundError, json.JSONDecodeError, subprocess.TimeoutExpired) as e:
             logger.debug(f"Helm detection unavailable: {e}")
 
-        # Method 2: Check kubectl deployments (for addons installed via kubectl apply)
+        return []
+
+    def _list_deployment_names(self, target: list[str], namespace: str) -> set[str]:
+        """List deployment names in a namespace.
+
+        Args:
+            target: Arguments selecting the cluster (see _cluster_args)
+            namespace: Namespace to list
+
+        Returns:
+            Set of deployment names (empty if the namespace can't be read)
+        """
+        if self._kubectl is None:
+            return set()
+
         try:
             result = subprocess.run(
                 [
-                    "kubectl",
+                    self._kubectl,
                     "get",
                     "deployments",
                     "-n",
-                    "kube-system",
-                    "--context",
-                    context,
+                    namespace,
+                    *target,
                     "-o",
-                    "json",
+                    "jsonpath={.items[*].metadata.name}",
                 ],
                 capture_output=True,
-                text=True,
                 timeout=5,
             )
 
             if result.returncode == 0:
-                data = json.loads(result.stdout)
-                deployment_names = {
-                    item.get("metadata", {}).get("name", "") for item in data.get("items", [])
-                }
+                return set(result.stdout.decode().split())
 
-                # Check for known deployment patterns
-                kubectl_checks = {
-                    "ingress-nginx": "ingress-nginx-controller",
-                    "metrics-server": "metrics-server",
-                }
+        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"kubectl detection failed in namespace '{namespace}': {e}")
 
-                for canonical_name, deployment_name in kubectl_checks.items():
-                    # Only add if not already found via Helm
-                    if canonical_name not in addons and deployment_name in deployment_names:
-                        addons[canonical_name] = {
-                            "installed": True,
-                            "method": "kubectl",
-                        }
+        return set()
 
-        except (FileNotFoundError, json.JSONDecodeError, subprocess.TimeoutExpired) as e:
-            logger.debug(f"kubectl detection failed: {e}")
+    def _list_addon_deployments(self, target: list[str]) -> dict[str, set[str]]:
+        """List deployment names in the namespaces addons are installed into.
 
-        # Check ingress-nginx namespace too (some installs put it there)
-        if "ingress-nginx" not in addons:
-            try:
-                result = subprocess.run(
-                    [
-                        "kubectl",
-                        "get",
-                        "deployments",
-                        "-n",
-                        "ingress-nginx",
-                        "--context",
-                        context,
-                        "-o",
-                        "json",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
+        Uses one cluster-wide kubectl call projected to namespace/name pairs, and
+        falls back to one call per namespace if that fails.
 
-                if result.returncode == 0:
-                    data = json.loads(result.stdout)
-                    if data.get("items"):
-                        addons["ingress-nginx"] = {
-                            "installed": True,
-                            "method": "kubectl",
-                            "namespace": "ingress-nginx",
-                        }
+        Args:
+            target: Arguments selecting the cluster (see _cluster_args)
 
-            except Exception as e:
-                logger.debug(f"ingress-nginx namespace check failed: {e}")
+        Returns:
+            Dict mapping namespace to its set of deployment names
+        """
+        namespaces: dict[str, set[str]] = {namespace: set() for namespace in _ADDON_NAMESPACES}
+        if self._kubectl is None:
+            return namespaces
+
+        try:
+            result = subprocess.run(
+                [
+                    self._kubectl,
+                    "get",
+                    "deployments",
+                    "--all-namespaces",
+                    *target,
+                    "-o",
+                    f"jsonpath={_DEPLOYMENT_JSONPATH}",
+                ],
+                capture_output=True,
+                timeout=5,
+            )
+
+            if result.returncode == 0:
+                for line in result.stdout.splitlines():
+                    namespace, _, deployment_name = line.decode().partition("\t")
+                    if namespace in namespaces:
+                        namespaces[namespace].add(deployment_name)
+                return namespaces
+
+        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"Cluster-wide deployment listing failed: {e}")
+
+        return {
+            namespace: self._list_deployment_names(target, namespace)
+            for namespace in _ADDON_NAMESPACES
+        }
+
+    def detect_addons(self, name: str) -> dict[str, Any]:
+        """Detect installed addons via Helm or kubectl.
+
+        Checks both Helm releases and kubectl deployments to detect addons
+        regardless of installation method. The Helm and kubectl lookups run concurrently.
+
+        Args:
+            name: Cluster name
+
+        Returns:
+            Dict mapping addon names to their status
+        """
+        addons = {}
+        target = self._cluster_args(name)
+
+        # Helm addons are installed through the cluster's saved kubeconfig, so without
+        # that file there is nothing for `helm list` to find
+        helm_future = None
+        if self.config is None or self.config.get_kubeconfig_path(name).is_file():
+            helm_future = self._executor.submit(
+                self._list_helm_releases, self._cluster_args(name, "--kube-context")
+            )
+        else:
+            logger.debug(f"No kubeconfig saved for '{name}', skipping helm probe")
+        deployments_future = self._executor.submit(self._list_addon_deployments, target)
+
+        # Method 1: Check Helm releases (for addons installed via create_cluster)
+        releases = helm_future.result() if helm_future else []
+        helm_addon_map = {
+            "ingress-nginx": ["ingress-nginx", "nginx-ingress"],
+            "metrics-server": ["metrics-server"],
+        }
+
+        # Index releases once so each addon is a dict lookup, not a scan
+        release_by_name = {r.get("name"): r for r in releases}
+        for canonical_name, release_names in helm_addon_map.items():
+            for release_name in release_names:
+                found = release_by_name.get(release_name)
+                if found:
+                    addons[canonical_name] = {
+                        "installed": True,
+                        "method": "helm",
+                        "version": found.get("app_version", "unknown"),
+                        "chart": found.get("chart", "unknown"),
+                    }
+                    break
+
+        # Everything was installed with Helm; the kubectl lookup can't add anything
+        if len(addons) == len(helm_addon_map):
+            return addons
+
+        # Method 2: Check kubectl deployments (for addons installed via kubectl apply)
+        deployments = deployments_future.result()
+        deployment_names = deployments["kube-system"]
+
+        # Check for known deployment patterns
+        kubectl_checks = {
+            "ingress-nginx": "ingress-nginx-controller",
+            "metrics-server": "metrics-server",
+        }
+
+        for canonical_name, deployment_name in kubectl_checks.items():
+            # Only add if not already found via Helm
+            if canonical_name not in addons and deployment_name in deployment_names:
+                addons[canonical_name] = {
+                    "installed": True,
+                    "method": "kubectl",
+                }
+
+        # Check ingress-nginx namespace too (some installs put it there)
+        if "ingress-nginx" not in addons and deployments["ingress-nginx"]:
+            addons["ingress-nginx"] = {
+                "installed": True,
+                "method": "kubectl",
+                "namespace": "ingress-nginx",
+            }
 
         return addons
 
+    def _count_system_pods(self, name: str) -> tuple[int, int] | None:
+        """Count running and total pods in kube-system.
+
+        Only the phase of each pod is needed, so kubectl projects it with jsonpath
+        rather than returning every full pod object.
+
+        Args:
+            name: Cluster name
+
+        Returns:
+            Tuple of (running or succeeded pods, total pods), or None if kubectl failed
+
+        Raises:
+            FileNotFoundError: If kubectl is not installed
+            subprocess.TimeoutExpired: If kubectl times out
+        """
+        if self._kubectl is None:
+            raise FileNotFoundError("kubectl")
+        target = self._cluster_args(name)
+        result = subprocess.run(
+            [
+                self._kubectl,
+                "get",
+                "pods",
+                "-n",
+                "kube-system",
+                *target,
+                "-o",
+                "jsonpath={.items[*].status.phase}",
+            ],
+            capture_output=True,
+            timeout=10,
+        )
+        if result.returncode != 0:
+            return None
+
+        phases = Counter(result.stdout.split())
+        return phases[b"Running"] + phases[b"Succeeded"], sum(phases.values())
+
     def check_cluster_health(self, name: str) -> dict[str, Any]:
         """Check overall cluster health.
 
@@ -340,10 +602,31 @@ class ClusterStatus:
             "checks": [],
         }
 
+        # The node and system pod probes are independent; run the node probe on the
+        # pool while the pod probe runs here
+        nodes_future = self._executor.submit(
+            self._cached, (name, "nodes"), self._summarize_nodes, name
+        )
+        pods_check: dict[str, str] | None = None
+        try:
+            pod_counts = self._count_system_pods(name)
+            if pod_counts is not None:
+                running_pods, total_pods = pod_counts
+                pods_check = {
+                    "name": "system_pods",
+                    "status": "pass" if running_pods == total_pods else "warn",
+                    "message": f"{running_pods}/{total_pods} system pods running",
+                }
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            pods_check = {
+                "name": "system_pods",
+                "status": "warn",
+                "message": "Could not check system pods",
+            }
+
         # Check nodes
-        nodes = self.get_node_status(name)
+        nodes, ready_nodes = nodes_future.result() or ([], 0)
         total_nodes = len(nodes)
-        ready_nodes = sum(1 for n in nodes if n.get("ready"))
 
         health["checks"].append(
             {
@@ -357,47 +640,7 @@ class ClusterStatus:
             health["healthy"] = False
 
         # Check system pods
-        try:
-            context = f"kind-{name}"
-            result = subprocess.run(
-                [
-                    "kubectl",
-                    "get",
-                    "pods",
-                    "-n",
-                    "kube-system",
-                    "--context",
-                    context,
-                    "-o",
-                    "json",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                pods = data.get("items", [])
-                running_pods = sum(
-                    1 for p in pods if p.get("status", {}).get("phase") in ["Running", "Succeeded"]
-                )
-
-                health["checks"].append(
-                    {
-                        "name": "system_pods",
-                        "status": "pass" if running_pods == len(pods) else "warn",
-                        "message": f"{running_pods}/{len(pods)} system pods running",
-                    }
-                )
-
-        except (subprocess.TimeoutExpired, json.JSONDecodeError):
-            health["checks"].append(
-                {
-                    "name": "system_pods",
-                    "status": "warn",
-                    "message": "Could not check system pods",
-                }
-            )
+        if pods_check is not None:
+            health["checks"].append(pods_check)
 
         return health
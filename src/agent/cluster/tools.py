@@ -3,20 +3,25 @@
 These functions are exposed as tools that the AI agent can use to manage KinD clusters.
 """
 
+import asyncio
+import copy
 import json
 import logging
+import os
+import shutil
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import yaml
-
-from agent.cluster.addons import AddonManager
-from agent.cluster.config import get_cluster_config
+from agent.cluster.config import get_cluster_config, parse_cluster_config
+from agent.cluster.config_merge import merge_addon_requirements
 from agent.cluster.kind_manager import KindManager
 from agent.cluster.kubectl_manager import KubectlManager
 from agent.cluster.status import ClusterStatus
 from agent.config import AgentConfig
+from agent.utils import json_compat
 from agent.utils.errors import (
     ClusterAlreadyExistsError,
     ClusterNotFoundError,
@@ -26,6 +31,10 @@ from agent.utils.errors import (
     KubectlCommandError,
     ResourceNotFoundError,
 )
+from agent.utils.port_checker import check_ingress_ports
+
+if TYPE_CHECKING:
+    from agent.cluster.addons import AddonManager
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +44,60 @@ _kubectl_manager: KubectlManager | None = None
 _cluster_status: ClusterStatus | None = None
 _config: AgentConfig | None = None
 
+# Seconds a `kind get clusters` result is reused by back-to-back tool calls
+_CLUSTER_LIST_TTL = 1.0
+
+
+class _ClusterListCache:
+    """Most recent `kind get clusters` result and when it was fetched."""
+
+    __slots__ = ("clusters", "fetched_at")
+
+    def __init__(self) -> None:
+        self.clusters: tuple[str, ...] | None = None
+        self.fetched_at = 0.0
+
+
+_cluster_list_cache = _ClusterListCache()
+
+# Seconds an ingress port check result is reused, e.g. by a retried create_cluster
+_PORT_CHECK_TTL = 2.0
+_port_check_cache: tuple[float, dict[str, Any]] | None = None
+
+# Seconds a read-only kubectl result (listing or describe) is reused for the same
+# query; a per-key lock collapses concurrent identical queries into one kubectl call.
+_RESOURCE_CACHE_TTL = 3.0
+# Key: (cluster, operation, resource type, namespace, label selector or object name)
+_ResourceKey = tuple[str, str, str, str, str | None]
+_resource_cache: dict[_ResourceKey, tuple[float, dict[str, Any]]] = {}
+
+
+class _KeyLock:
+    """Lock for one resource cache key and the number of callers holding or awaiting it."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+# Only keys with an in-flight query have an entry
+_resource_locks: dict[_ResourceKey, _KeyLock] = {}
+
+# Kubeconfig path handed to the pre-creation AddonManager; never read, since the
+# pre-creation hooks must not touch cluster state
+_ADDON_PLACEHOLDER_KUBECONFIG = Path("/tmp/placeholder")
+
+# Addon names (normalized like AddonManager does) that install the ingress controller
+_INGRESS_ALIASES = frozenset({"ingress", "ingress-nginx", "nginx"})
+
+# Port conflict descriptions, keyed on the owner field present in the conflict
+_CONFLICT_FMT = {
+    "cluster_name": "Port {port} is in use by Kind cluster '{cluster_name}'",
+    "container": "Port {port} is in use by Docker container '{container}'",
+}
+
 
 def initialize_tools(config: AgentConfig) -> None:
     """Initialize tools with configuration.
@@ -47,23 +110,200 @@ def initialize_tools(config: AgentConfig) -> None:
     _kind_manager = KindManager()
     _kubectl_manager = KubectlManager(config)
     _cluster_status = ClusterStatus(config)
+    _invalidate_cluster_cache()
+
+
+async def shutdown_tools() -> None:
+    """Release resources held by the tools (kubectl proxies, their HTTP session and
+    the status probe threads).
+
+    Safe to call when the tools were never initialized.
+    """
+    if _kubectl_manager:
+        await _kubectl_manager.close()
+    if _cluster_status:
+        _cluster_status.close()
+
+
+async def _get_cached_clusters() -> list[str]:
+    """List kind clusters, reusing a result fetched within the last second.
+
+    Returns:
+        List of cluster names
+
+    Raises:
+        KindCommandError: If listing fails
+    """
+    if not _kind_manager:
+        raise RuntimeError("Tools not initialized. Call initialize_tools() first.")
+
+    cache = _cluster_list_cache
+    now = time.monotonic()
+    if cache.clusters is None or now - cache.fetched_at > _CLUSTER_LIST_TTL:
+        cache.clusters = tuple(await _kind_manager.list_clusters())
+        cache.fetched_at = now
+    return list(cache.clusters)
+
+
+async def _cluster_exists(name: str) -> bool:
+    """Check if a cluster exists using the cached cluster list.
+
+    Args:
+        name: Cluster name
+
+    Returns:
+        True if cluster exists
+    """
+    try:
+        return name in await _get_cached_clusters()
+    except (KindCommandError, FileNotFoundError):
+        return False
+
+
+def _cached_check_ingress_ports() -> dict[str, Any]:
+    """Check ingress port availability, reusing a result from the last two seconds.
+
+    Returns:
+        Port status dictionary from check_ingress_ports
+    """
+    global _port_check_cache
+    now = time.monotonic()
+    if _port_check_cache and now - _port_check_cache[0] < _PORT_CHECK_TTL:
+        return _port_check_cache[1]
+    result = check_ingress_ports()
+    _port_check_cache = (now, result)
+    return result
+
+
+def _invalidate_cluster_cache() -> None:
+    """Drop all cached cluster lookups after a cluster is created or removed."""
+    global _port_check_cache
+    _cluster_list_cache.clusters = None
+    _port_check_cache = None
+    _resource_cache.clear()
+
+
+def _invalidate_resource_cache(cluster_name: str) -> None:
+    """Drop cached resource queries for a cluster after it is modified.
+
+    Args:
+        cluster_name: Cluster whose resources changed
+    """
+    for key in [key for key in _resource_cache if key[0] == cluster_name]:
+        del _resource_cache[key]
+
+
+async def _cached_resource_call(
+    key: _ResourceKey, fetch: Callable[[], Awaitable[dict[str, Any]]]
+) -> dict[str, Any]:
+    """Run a read-only kubectl query, reusing its result from the last few seconds.
+
+    Concurrent callers for the same key share a single kubectl call.
+
+    Args:
+        key: Cache key; the first element is the cluster name
+        fetch: Coroutine function performing the query
+
+    Returns:
+        Query result (a private copy)
+    """
+    key_lock = _resource_locks.get(key)
+    if key_lock is None:
+        key_lock = _resource_locks[key] = _KeyLock()
+    key_lock.users += 1
+    try:
+        async with key_lock.lock:
+            cached = _resource_cache.get(key)
+            if cached:
+                if time.monotonic() - cached[0] < _RESOURCE_CACHE_TTL:
+                    logger.debug(
+                        f"Reusing cached kubectl {key[1]} of {key[2]} in cluster '{key[0]}'"
+                    )
+                    return copy.deepcopy(cached[1])
+                del _resource_cache[key]
+
+            result = await fetch()
+            now = time.monotonic()
+            # Results are only useful for a few seconds; don't keep large listings around
+            for stale in [
+                k for k, (at, _) in _resource_cache.items() if now - at >= _RESOURCE_CACHE_TTL
+            ]:
+                del _resource_cache[stale]
+            _resource_cache[key] = (now, copy.deepcopy(result))
+            return result
+    finally:
+        key_lock.users -= 1
+        if not key_lock.users:
+            del _resource_locks[key]
+
+
+async def _get_resources_cached(
+    cluster_name: str, resource_type: str, namespace: str, label_selector: str | None
+) -> dict[str, Any]:
+    """Get resources, reusing a result for the same query from the last few seconds.
+
+    Args:
+        cluster_name: Name of the cluster to query
+        resource_type: Type of resource to get
+        namespace: Kubernetes namespace
+        label_selector: Optional label selector
+
+    Returns:
+        Resource listing from KubectlManager.get_resources (a private copy)
+    """
+    manager = _kubectl_manager
+    if not manager:
+        raise RuntimeError("Tools not initialized. Call initialize_tools() first.")
+
+    return await _cached_resource_call(
+        (cluster_name, "get", resource_type.lower(), namespace, label_selector),
+        lambda: manager.get_resources(cluster_name, resource_type, namespace, label_selector),
+    )
+
+
+async def _describe_resource_cached(
+    cluster_name: str, resource_type: str, name: str, namespace: str
+) -> dict[str, Any]:
+    """Describe a resource, reusing a description from the last few seconds.
+
+    Args:
+        cluster_name: Name of the cluster to query
+        resource_type: Type of resource
+        name: Resource name
+        namespace: Kubernetes namespace
+
+    Returns:
+        Description from KubectlManager.describe_resource (a private copy)
+    """
+    manager = _kubectl_manager
+    if not manager:
+        raise RuntimeError("Tools not initialized. Call initialize_tools() first.")
+
+    return await _cached_resource_call(
+        (cluster_name, "describe", resource_type.lower(), namespace, name),
+        lambda: manager.describe_resource(cluster_name, resource_type, name, namespace),
+    )
 
 
-def _save_cluster_state(cluster_data_dir: Path, state: dict[str, Any]) -> None:
-    """Save cluster state to JSON file.
+async def _save_cluster_state(cluster_data_dir: Path, state: dict[str, Any]) -> None:
+    """Save cluster state to JSON file without blocking the event loop.
 
     Args:
         cluster_data_dir: Cluster data directory
         state: State dictionary to save
     """
-    cluster_data_dir.mkdir(parents=True, exist_ok=True)
     state_file = cluster_data_dir / "cluster-state.json"
-    state_file.write_text(json.dumps(state, indent=2))
+
+    def write() -> None:
+        cluster_data_dir.mkdir(parents=True, exist_ok=True)
+        state_file.write_bytes(json_compat.dumps(state, indent=True))
+
+    await asyncio.to_thread(write)
     logger.debug(f"Saved cluster state to {state_file}")
 
 
-def _load_cluster_state(cluster_data_dir: Path) -> dict[str, Any] | None:
-    """Load cluster state from JSON file.
+async def _load_cluster_state(cluster_data_dir: Path) -> dict[str, Any] | None:
+    """Load cluster state from JSON file without blocking the event loop.
 
     Args:
         cluster_data_dir: Cluster data directory
@@ -72,11 +312,15 @@ def _load_cluster_state(cluster_data_dir: Path) -> dict[str, Any] | None:
         State dictionary or None if file doesn't exist
     """
     state_file = cluster_data_dir / "cluster-state.json"
-    if not state_file.exists():
-        return None
+
+    def read() -> bytes | None:
+        return state_file.read_bytes() if state_file.exists() else None
 
     try:
-        state: dict[str, Any] = json.loads(state_file.read_text())
+        content = await asyncio.to_thread(read)
+        if content is None:
+            return None
+        state: dict[str, Any] = json_compat.loads(content)
         logger.debug(f"Loaded cluster state from {state_file}")
         return state
     except (json.JSONDecodeError, OSError) as e:
@@ -84,6 +328,72 @@ def _load_cluster_state(cluster_data_dir: Path) -> dict[str, Any] | None:
         return None
 
 
+async def _create_kind_cluster(name: str, config_path: Path, k8s_version: str) -> dict[str, Any]:
+    """Create a kind cluster from a config file and drop cached state it invalidates.
+
+    Args:
+        name: Cluster name
+        config_path: Path to KinD configuration YAML
+        k8s_version: Kubernetes version
+
+    Returns:
+        Cluster creation result from KindManager
+    """
+    if not _kind_manager:
+        raise RuntimeError("Tools not initialized. Call initialize_tools() first.")
+
+    try:
+        return await _kind_manager.create_cluster_from_file(name, config_path, k8s_version)
+    finally:
+        _invalidate_cluster_cache()
+
+
+def _describe_port_conflict(conflict: dict[str, Any]) -> str:
+    """Describe a single port conflict for the port-conflict error message.
+
+    Args:
+        conflict: Conflict entry from check_ingress_ports
+
+    Returns:
+        Human-readable description of what holds the port
+    """
+    for key, template in _CONFLICT_FMT.items():
+        if conflict.get(key):
+            return template.format(**conflict)
+    return f"Port {conflict['port']} is in use"
+
+
+def _collect_addon_requirements(manager: "AddonManager", addons: list[str]) -> list[dict[str, Any]]:
+    """Collect pre-creation configuration requirements from each addon in turn.
+
+    Addons that fail to load are logged and skipped.
+
+    Args:
+        manager: Addon manager used to resolve and instantiate the addons
+        addons: Addon names or aliases
+
+    Returns:
+        Non-empty requirements dictionaries, in request order
+    """
+    addon_requirements = []
+    for addon_name in addons:
+        try:
+            # Resolve addon name to canonical form
+            canonical_name = manager.resolve_addon_name(addon_name)
+
+            # Get temporary addon instance for config collection
+            addon = manager.get_addon_instance(canonical_name, None)
+
+            addon_req: dict[str, Any] = addon.get_all_requirements()
+        except Exception as e:
+            logger.warning(f"Failed to collect config requirements from addon '{addon_name}': {e}")
+            continue
+        if addon_req:
+            addon_requirements.append(addon_req)
+            logger.debug(f"Addon '{addon_name}' has configuration requirements")
+    return addon_requirements
+
+
 async def create_cluster(
     name: str,
     config: str = "default",
@@ -138,12 +448,15 @@ async def create_cluster(
     if not _kind_manager or not _config:
         raise RuntimeError("Tools not initialized. Call initialize_tools() first.")
 
+    # Addon modules are only needed here, so import them lazily to keep tool import cheap
+    from agent.cluster.addons import AddonManager
+
     cluster_data_dir = _config.get_cluster_data_dir(name)
     is_restart = cluster_data_dir.exists()
 
     try:
         # Check if cluster is already running
-        if await _kind_manager.cluster_exists(name):
+        if await _cluster_exists(name):
             return {
                 "success": False,
                 "error": "cluster_already_running",
@@ -154,8 +467,12 @@ async def create_cluster(
         if is_restart:
             logger.info(f"Restarting cluster '{name}' from saved configuration")
 
-            # Load saved state
-            saved_state = _load_cluster_state(cluster_data_dir)
+            # Load saved state and check for the saved config concurrently, off the event loop
+            saved_config_path = cluster_data_dir / "kind-config.yaml"
+            saved_state, has_saved_config = await asyncio.gather(
+                _load_cluster_state(cluster_data_dir),
+                asyncio.to_thread(saved_config_path.is_file),
+            )
             if not saved_state:
                 return {
                     "success": False,
@@ -163,29 +480,25 @@ async def create_cluster(
                     "message": f"Cluster '{name}' data exists but state file is missing or corrupt. Cannot restart.",
                 }
 
-            # Load saved config
-            saved_config_path = cluster_data_dir / "kind-config.yaml"
-            if not saved_config_path.exists():
+            if not has_saved_config:
                 return {
                     "success": False,
                     "error": "missing_config",
                     "message": f"Cluster '{name}' data exists but configuration file is missing. Cannot restart.",
                 }
 
-            cluster_config_yaml = saved_config_path.read_text()
             k8s_version = saved_state.get("kubernetes_version", _config.default_k8s_version)
             saved_addons = saved_state.get("addons", [])
 
             logger.info(f"Recreating cluster '{name}' with saved config, version {k8s_version}")
 
-            # Create cluster from saved config
-            result = await _kind_manager.create_cluster(name, cluster_config_yaml, k8s_version)
+            # Create cluster from saved config (kind reads the snapshot file directly)
+            result = await _create_kind_cluster(name, saved_config_path, k8s_version)
 
             # Export and save kubeconfig
+            kubeconfig_path = _config.get_kubeconfig_path(name)
             try:
-                kubeconfig_path = _config.get_kubeconfig_path(name)
-                kubeconfig_content = await _kind_manager.get_kubeconfig(name)
-                kubeconfig_path.write_text(kubeconfig_content)
+                await _kind_manager.write_kubeconfig(name, kubeconfig_path)
                 result["kubeconfig_path"] = str(kubeconfig_path)
                 logger.info(f"Kubeconfig saved to {kubeconfig_path}")
             except (OSError, PermissionError, KindCommandError, ClusterNotFoundError) as e:
@@ -200,7 +513,7 @@ async def create_cluster(
                 logger.info(
                     f"Reinstalling {len(saved_addons)} add-on(s): {', '.join(saved_addons)}"
                 )
-                addon_manager = AddonManager(name, Path(result["kubeconfig_path"]))
+                addon_manager = AddonManager(name, kubeconfig_path)
                 addon_result = await addon_manager.install_addons(saved_addons)
                 result["addons_installed"] = addon_result
 
@@ -235,48 +548,25 @@ async def create_cluster(
             config, name, data_dir=Path(_config.data_dir)
         )
 
-        # Parse YAML string to dict for manipulation
-        cluster_config = yaml.safe_load(cluster_config_yaml)
-
         # Use configured default version if not specified
         k8s_version = kubernetes_version or _config.default_k8s_version
 
         # PHASE 1: Collect and merge addon configuration requirements (pre-cluster creation)
         if addons:
-            from agent.cluster.config_merge import merge_addon_requirements
-            from agent.utils.port_checker import check_ingress_ports
-
             logger.info(f"Collecting configuration requirements from {len(addons)} addon(s)")
 
-            # Temporary addon manager to get addon classes (no kubeconfig yet)
-            temp_manager = AddonManager(name, Path("/tmp/placeholder"))
-
             # Check for ingress addon and port conflicts BEFORE expensive operations
-            has_ingress = any(
-                addon.lower() in ["ingress", "ingress-nginx", "nginx"] for addon in addons
-            )
+            has_ingress = any(addon.lower().strip() in _INGRESS_ALIASES for addon in addons)
             if has_ingress:
                 logger.info("Checking ingress port availability (80, 443)")
-                port_status = check_ingress_ports()
+                port_status = _cached_check_ingress_ports()
 
                 if not port_status["available"]:
                     conflicting_cluster = port_status.get("conflicting_cluster")
                     conflicts = port_status.get("conflicts", [])
 
                     # Build detailed error message for LLM to present naturally
-                    conflict_details = []
-                    for c in conflicts:
-                        port_num = c["port"]
-                        if c.get("cluster_name"):
-                            conflict_details.append(
-                                f"Port {port_num} is in use by Kind cluster '{c['cluster_name']}'"
-                            )
-                        elif c.get("container"):
-                            conflict_details.append(
-                                f"Port {port_num} is in use by Docker container '{c['container']}'"
-                            )
-                        else:
-                            conflict_details.append(f"Port {port_num} is in use")
+                    conflict_details = [_describe_port_conflict(c) for c in conflicts]
 
                     logger.warning(
                         f"Port conflict detected for ingress addon: {'; '.join(conflict_details)}"
@@ -305,87 +595,85 @@ async def create_cluster(
                         "message": error_msg,
                     }
 
-            addon_requirements = []
-            for addon_name in addons:
-                try:
-                    # Resolve addon name to canonical form
-                    canonical_name = temp_manager.resolve_addon_name(addon_name)
-
-                    # Get temporary addon instance for config collection
-                    temp_addon = temp_manager.get_addon_instance(canonical_name, None)
-
-                    # Collect all requirements from this addon
-                    addon_req = {}
-
-                    # Cluster config requirements
-                    config_req = temp_addon.get_cluster_config_requirements()
-                    if config_req:
-                        addon_req.update(config_req)
-
-                    # Port requirements
-                    port_req = temp_addon.get_port_requirements()
-                    if port_req:
-                        addon_req["port_mappings"] = port_req
-
-                    # Node label requirements
-                    label_req = temp_addon.get_node_labels()
-                    if label_req:
-                        addon_req["node_labels"] = label_req
-
-                    if addon_req:
-                        addon_requirements.append(addon_req)
-                        logger.debug(f"Addon '{addon_name}' has configuration requirements")
+            # Temporary addon manager to get addon classes (no kubeconfig yet)
+            temp_manager = AddonManager(name, _ADDON_PLACEHOLDER_KUBECONFIG)
 
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to collect config requirements from addon '{addon_name}': {e}"
-                    )
+            # Addon modules are imported lazily and the first lookup of each one
+            # touches disk, so collect off the event loop - in a single worker thread,
+            # since AddonManager's lazy loading is not meant to be shared across threads
+            addon_requirements = await asyncio.to_thread(
+                _collect_addon_requirements, temp_manager, addons
+            )
 
-            # Merge all addon requirements into cluster config
+            # Merge all addon requirements into cluster config. The YAML is only
+            # parsed and re-serialized when there is something to merge.
             if addon_requirements:
-                cluster_config = merge_addon_requirements(cluster_config, addon_requirements)
+                import yaml
+
+                cluster_config = merge_addon_requirements(
+                    parse_cluster_config(cluster_config_yaml), addon_requirements
+                )
                 logger.info(
                     f"Merged configuration requirements from {len(addon_requirements)} addon(s)"
                 )
 
-        # Convert cluster config dict back to YAML string for kind_manager
-        cluster_config_yaml = yaml.safe_dump(
-            cluster_config, default_flow_style=False, sort_keys=False
-        )
+                # Convert cluster config dict back to YAML string for kind_manager,
+                # preferring libyaml's C dumper
+                cluster_config_yaml = yaml.dump(
+                    cluster_config,
+                    Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
 
         logger.info(
             f"Creating cluster '{name}' with config '{config}' ({config_source}), "
             f"version {k8s_version}"
         )
 
+        # Save config snapshot for future recreation first, then hand kind the snapshot
+        # file so the YAML is only written once
+        config_snapshot_path = cluster_data_dir / "kind-config.yaml"
+        try:
+            await asyncio.to_thread(cluster_data_dir.mkdir, parents=True, exist_ok=True)
+            await asyncio.to_thread(config_snapshot_path.write_text, cluster_config_yaml)
+        except OSError as e:
+            logger.error(f"Failed to save config snapshot for cluster '{name}': {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "message": f"Cannot create cluster '{name}': failed to write cluster data: {e}",
+            }
+        logger.info(f"Config snapshot saved to {config_snapshot_path}")
+
         # Create cluster with merged configuration
-        result = await _kind_manager.create_cluster(name, cluster_config_yaml, k8s_version)
+        try:
+            result = await _create_kind_cluster(name, config_snapshot_path, k8s_version)
+        except BaseException:
+            # Don't leave data behind that would make the next attempt look like a restart
+            await asyncio.to_thread(shutil.rmtree, cluster_data_dir, ignore_errors=True)
+            raise
 
         # Export and save kubeconfig
+        kubeconfig_path = _config.get_kubeconfig_path(name)
         try:
-            kubeconfig_path = _config.get_kubeconfig_path(name)
-            kubeconfig_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Export kubeconfig from kind
-            kubeconfig_content = await _kind_manager.get_kubeconfig(name)
-            kubeconfig_path.write_text(kubeconfig_content)
-
-            result["kubeconfig_path"] = str(kubeconfig_path)
-            logger.info(f"Kubeconfig saved to {kubeconfig_path}")
-
-            # Save config snapshot for future recreation
-            config_snapshot_path = kubeconfig_path.parent / "kind-config.yaml"
-            config_snapshot_path.write_text(cluster_config_yaml)
-            logger.info(f"Config snapshot saved to {config_snapshot_path}")
-
-            # Save cluster state for restart
+            # Cluster state for restart
             cluster_state = {
                 "addons": addons or [],
                 "kubernetes_version": k8s_version,
                 "config_template": config,
                 "created_at": datetime.now().isoformat(),
             }
-            _save_cluster_state(cluster_data_dir, cluster_state)
+
+            # Export kubeconfig from kind and save state concurrently, off the event loop
+            await asyncio.to_thread(kubeconfig_path.parent.mkdir, parents=True, exist_ok=True)
+            await asyncio.gather(
+                _kind_manager.write_kubeconfig(name, kubeconfig_path),
+                _save_cluster_state(cluster_data_dir, cluster_state),
+            )
+
+            result["kubeconfig_path"] = str(kubeconfig_path)
+            logger.info(f"Kubeconfig saved to {kubeconfig_path}")
             logger.info("Cluster state saved")
 
         except (OSError, PermissionError, KindCommandError, ClusterNotFoundError) as e:
@@ -402,7 +690,7 @@ async def create_cluster(
         # PHASE 2: Install add-ons (post-cluster creation, only if kubeconfig saved successfully)
         if addons and result.get("kubeconfig_path"):
             logger.info(f"Installing {len(addons)} add-on(s): {', '.join(addons)}")
-            addon_manager = AddonManager(name, Path(result["kubeconfig_path"]))
+            addon_manager = AddonManager(name, kubeconfig_path)
             addon_result = await addon_manager.install_addons(addons)
 
             result["addons_installed"] = addon_result
@@ -516,7 +804,7 @@ async def remove_cluster(
 
     try:
         # Check if cluster exists (either running or stopped with data)
-        cluster_running = await _kind_manager.cluster_exists(name)
+        cluster_running = await _cluster_exists(name)
         cluster_data_dir = _config.get_cluster_data_dir(name)
         cluster_data_exists = cluster_data_dir.exists()
 
@@ -527,6 +815,10 @@ async def remove_cluster(
                 "message": f"Cluster '{name}' not found (no running cluster or saved data). Use list_clusters to see available clusters.",
             }
 
+        # Drop any kubectl proxy or cached validation still pointing at this cluster
+        if _kubectl_manager:
+            await _kubectl_manager.forget_cluster(name)
+
         # Stop cluster if running
         if cluster_running:
             logger.info(f"Stopping cluster '{name}' (purge_data={purge_data})")
@@ -539,9 +831,7 @@ async def remove_cluster(
         if purge_data:
             if cluster_data_exists:
                 try:
-                    import shutil
-
-                    shutil.rmtree(cluster_data_dir)
+                    await asyncio.to_thread(shutil.rmtree, cluster_data_dir)
                     logger.info(f"Purged cluster data directory: {cluster_data_dir}")
                     result["data_deleted"] = True
                     result["message"] = (
@@ -589,6 +879,8 @@ async def remove_cluster(
             "error": str(e),
             "message": f"Unexpected error removing cluster: {e}",
         }
+    finally:
+        _invalidate_cluster_cache()
 
 
 async def list_clusters() -> dict[str, Any]:
@@ -618,22 +910,24 @@ async def list_clusters() -> dict[str, Any]:
         logger.info("Listing all clusters")
 
         # Get running clusters from kind
-        running_clusters = await _kind_manager.list_clusters()
+        running_clusters = await _get_cached_clusters()
 
-        # Get stopped clusters by checking data directories
+        # Get stopped clusters by checking data directories. scandir entries carry
+        # their file type from the directory read, so is_dir() needs no extra stat.
         stopped_clusters = []
+        running_set = set(running_clusters)
         clusters_dir = Path(_config.data_dir) / "clusters"
         if clusters_dir.exists():
-            for cluster_dir in clusters_dir.iterdir():
-                if cluster_dir.is_dir():
-                    cluster_name = cluster_dir.name
-                    # Only include if not currently running
-                    if cluster_name not in running_clusters:
-                        # Verify it has valid cluster data (state file or config)
-                        has_state = (cluster_dir / "cluster-state.json").exists()
-                        has_config = (cluster_dir / "kind-config.yaml").exists()
-                        if has_state or has_config:
-                            stopped_clusters.append(cluster_name)
+            with os.scandir(clusters_dir) as entries:
+                for entry in entries:
+                    # Only include directories of clusters not currently running
+                    if not entry.is_dir() or entry.name in running_set:
+                        continue
+                    # Verify it has valid cluster data (state file or config)
+                    state_file = os.path.join(entry.path, "cluster-state.json")
+                    config_file = os.path.join(entry.path, "kind-config.yaml")
+                    if os.path.exists(state_file) or os.path.exists(config_file):
+                        stopped_clusters.append(entry.name)
 
         total = len(running_clusters) + len(stopped_clusters)
 
@@ -700,14 +994,15 @@ async def cluster_status(name: str) -> dict[str, Any]:
         logger.info(f"Getting status for cluster '{name}'")
 
         # Check if cluster exists
-        if not await _kind_manager.cluster_exists(name):
+        if not await _cluster_exists(name):
             return {
                 "success": False,
                 "error": f"Cluster '{name}' not found",
                 "message": f"Cluster '{name}' not found. Use list_clusters to see available clusters.",
             }
 
-        status = _cluster_status.get_cluster_status(name)
+        # The probes block on kubectl/helm subprocesses; keep them off the event loop
+        status = await asyncio.to_thread(_cluster_status.get_cluster_status, name)
         status["success"] = True
         status["message"] = (
             f"Cluster '{name}' is {status['status']} with "
@@ -731,7 +1026,7 @@ async def cluster_status(name: str) -> dict[str, Any]:
         }
 
 
-def get_cluster_health(name: str) -> dict[str, Any]:
+async def get_cluster_health(name: str) -> dict[str, Any]:
     """Check health of a cluster.
 
     This tool performs health checks on a cluster including node readiness
@@ -752,7 +1047,8 @@ def get_cluster_health(name: str) -> dict[str, Any]:
     try:
         logger.info(f"Checking health for cluster '{name}'")
 
-        health = _cluster_status.check_cluster_health(name)
+        # The probes block on kubectl subprocesses; keep them off the event loop
+        health = await asyncio.to_thread(_cluster_status.check_cluster_health, name)
         health["success"] = True
         health["message"] = f"Cluster '{name}' is {'healthy' if health['healthy'] else 'unhealthy'}"
 
@@ -816,9 +1112,7 @@ async def kubectl_get_resources(
             f"Getting {resource_type} from cluster '{cluster_name}', namespace '{namespace}'"
         )
 
-        result = await _kubectl_manager.get_resources(
-            cluster_name, resource_type, namespace, label_selector
-        )
+        result = await _get_resources_cached(cluster_name, resource_type, namespace, label_selector)
 
         result["success"] = True
         result["message"] = (
@@ -858,11 +1152,13 @@ async def kubectl_apply(
 
     This tool deploys applications and resources to a cluster by applying
     Kubernetes YAML manifests. Use this to deploy applications, create services,
-    or apply any Kubernetes configuration.
+    or apply any Kubernetes configuration. To deploy several resources, pass them
+    together as one multi-document manifest (separated by "---") rather than
+    calling this tool once per resource; they are applied in a single pass.
 
     Args:
         cluster_name: Name of the cluster to apply to
-        manifest: YAML manifest content to apply
+        manifest: YAML manifest content to apply (may contain multiple documents)
         namespace: Kubernetes namespace (default: "default")
 
     Returns:
@@ -877,6 +1173,7 @@ async def kubectl_apply(
     Examples:
         - kubectl_apply("dev", nginx_deployment_yaml)
         - kubectl_apply("staging", service_yaml, namespace="apps")
+        - kubectl_apply("dev", deployment_and_service_yaml)  # multi-document manifest
     """
     if not _kubectl_manager:
         raise RuntimeError("Tools not initialized. Call initialize_tools() first.")
@@ -919,6 +1216,9 @@ async def kubectl_apply(
             "error": str(e),
             "message": f"Unexpected error applying manifest: {e}",
         }
+    finally:
+        # The cluster may have changed even if kubectl reported an error
+        _invalidate_resource_cache(cluster_name)
 
 
 async def kubectl_delete(
@@ -991,6 +1291,9 @@ async def kubectl_delete(
             "error": str(e),
             "message": f"Unexpected error deleting resource: {e}",
         }
+    finally:
+        # The cluster may have changed even if kubectl reported an error
+        _invalidate_resource_cache(cluster_name)
 
 
 async def kubectl_logs(
@@ -1115,9 +1418,7 @@ async def kubectl_describe(
             f"namespace '{namespace}'"
         )
 
-        result = await _kubectl_manager.describe_resource(
-            cluster_name, resource_type, name, namespace
-        )
+        result = await _describe_resource_cached(cluster_name, resource_type, name, namespace)
 
         result["success"] = True
         result["message"] = (
@@ -1156,8 +1457,8 @@ async def kubectl_describe(
         }
 
 
-# Tool metadata for agent framework
-CLUSTER_TOOLS = [
+# Tool metadata for agent framework (immutable; callers copy it before extending)
+CLUSTER_TOOLS: tuple[Callable[..., Any], ...] = (
     create_cluster,
     remove_cluster,
     list_clusters,
@@ -1168,4 +1469,4 @@ CLUSTER_TOOLS = [
     kubectl_delete,
     kubectl_logs,
     kubectl_describe,
-]
+)
@@ -5,7 +5,7 @@ including multi-provider LLM configuration (OpenAI and Azure OpenAI).
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
@@ -43,6 +43,10 @@ class AgentConfig:
     cluster_prefix: str = "butler-"
     default_k8s_version: str = "v1.34.0"
     log_level: str = "info"
+    kubectl_proxy: bool = False
+    kubectl_max_concurrency: int = 8
+    # Unparseable BUTLER_KUBECTL_MAX_CONCURRENCY value, reported by validate()
+    _invalid_kubectl_max_concurrency: str | None = field(default=None, init=False, repr=False)
 
     # Observability Configuration (optional)
     applicationinsights_connection_string: str | None = None
@@ -80,6 +84,19 @@ class AgentConfig:
         self.cluster_prefix = os.getenv("BUTLER_CLUSTER_PREFIX", self.cluster_prefix)
         self.default_k8s_version = os.getenv("BUTLER_DEFAULT_K8S_VERSION", self.default_k8s_version)
         self.log_level = os.getenv("LOG_LEVEL", self.log_level).lower()
+        self.kubectl_proxy = os.getenv("BUTLER_KUBECTL_PROXY", str(self.kubectl_proxy)).lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        max_concurrency = os.getenv(
+            "BUTLER_KUBECTL_MAX_CONCURRENCY", str(self.kubectl_max_concurrency)
+        )
+        try:
+            self.kubectl_max_concurrency = max(1, int(max_concurrency))
+        except ValueError:
+            # Keep the default so construction succeeds; validate() reports the value
+            self._invalid_kubectl_max_concurrency = max_concurrency
 
         # Observability Configuration
         self.applicationinsights_connection_string = os.getenv(
@@ -102,7 +119,8 @@ class AgentConfig:
         """Validate configuration based on selected provider.
 
         Raises:
-            ValueError: If required credentials for the selected provider are missing.
+            ValueError: If required credentials for the selected provider are missing,
+                or an agent setting cannot be parsed.
         """
         if self.llm_provider == "openai":
             if not self.openai_api_key:
@@ -127,6 +145,12 @@ class AgentConfig:
                 f"Invalid LLM provider: {self.llm_provider}. " "Must be one of: openai, azure"
             )
 
+        if self._invalid_kubectl_max_concurrency is not None:
+            raise ValueError(
+                f"Invalid BUTLER_KUBECTL_MAX_CONCURRENCY: "
+                f"{self._invalid_kubectl_max_concurrency!r}. Must be an integer"
+            )
+
     def get_cluster_data_dir(self, cluster_name: str) -> Path:
         """Get data directory path for a specific cluster.
 
@@ -6,29 +6,96 @@ the event loop to continue running during long-running operations.
 
 import asyncio
 import logging
-from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
 class AsyncCompletedProcess:
     """Async version of subprocess.CompletedProcess.
 
     Mirrors the interface of subprocess.CompletedProcess for compatibility
     with existing code that expects returncode, stdout, stderr attributes.
+
+    Output is kept as raw bytes and only decoded to str the first time
+    ``stdout``/``stderr`` is read, so callers that parse bytes directly
+    (e.g. JSON) or never look at stderr skip the UTF-8 decode entirely.
     """
 
-    args: list[str] | str
-    returncode: int
-    stdout: str = ""
-    stderr: str = ""
+    def __init__(
+        self,
+        args: list[str] | str,
+        returncode: int,
+        stdout: str | bytes = "",
+        stderr: str | bytes = "",
+    ):
+        """Initialize completed process result.
+
+        Args:
+            args: Command that was run
+            returncode: Process exit code
+            stdout: Captured standard output (str or raw bytes)
+            stderr: Captured standard error (str or raw bytes)
+        """
+        self.args = args
+        self.returncode = returncode
+        self._stdout = stdout
+        self._stderr = stderr
+
+    @staticmethod
+    def _as_text(value: str | bytes) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    @property
+    def stdout(self) -> str:
+        """Standard output decoded as UTF-8 (decoded once, on first access)."""
+        self._stdout = self._as_text(self._stdout)
+        return self._stdout
+
+    @property
+    def stderr(self) -> str:
+        """Standard error decoded as UTF-8 (decoded once, on first access)."""
+        self._stderr = self._as_text(self._stderr)
+        return self._stderr
+
+    @property
+    def stdout_bytes(self) -> bytes:
+        """Standard output as raw bytes, without decoding."""
+        if isinstance(self._stdout, str):
+            return self._stdout.encode("utf-8")
+        return self._stdout
+
+    @property
+    def stderr_bytes(self) -> bytes:
+        """Standard error as raw bytes, without decoding."""
+        if isinstance(self._stderr, str):
+            return self._stderr.encode("utf-8")
+        return self._stderr
+
+    def __eq__(self, other: object) -> bool:
+        # Equal when the same output was captured, whether it is held as str or bytes
+        if not isinstance(other, AsyncCompletedProcess):
+            return NotImplemented
+        return (
+            self.args == other.args
+            and self.returncode == other.returncode
+            and self.stdout_bytes == other.stdout_bytes
+            and self.stderr_bytes == other.stderr_bytes
+        )
+
+    # Mutable like the dataclass it replaces, so unhashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"AsyncCompletedProcess(args={self.args!r}, returncode={self.returncode!r}, "
+            f"stdout={self._stdout!r}, stderr={self._stderr!r})"
+        )
 
 
 async def run_async(
     cmd: list[str],
     env: dict[str, str] | None = None,
-    timeout: int | None = None,
+    timeout: float | None = None,
     check: bool = False,
     capture_output: bool = True,
 ) -> AsyncCompletedProcess:
@@ -57,7 +124,8 @@ async def run_async(
         if result.returncode == 0:
             print(result.stdout)
     """
-    logger.debug(f"Running async command: {' '.join(cmd)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Running async command: {' '.join(cmd)}")
 
     try:
         # Create subprocess with pipes if capturing output
@@ -89,13 +157,12 @@ async def run_async(
             logger.error(f"Command timed out after {timeout}s: {' '.join(cmd)}")
             raise
 
-        # Decode output
-        stdout = stdout_bytes.decode("utf-8") if stdout_bytes else ""
-        stderr = stderr_bytes.decode("utf-8") if stderr_bytes else ""
-
-        # Create result
+        # Create result (output is decoded lazily on first access)
         result = AsyncCompletedProcess(
-            args=cmd, returncode=process.returncode or 0, stdout=stdout, stderr=stderr
+            args=cmd,
+            returncode=process.returncode or 0,
+            stdout=stdout_bytes or b"",
+            stderr=stderr_bytes or b"",
         )
 
         # Check for errors if requested
@@ -105,14 +172,15 @@ async def run_async(
             raise subprocess.CalledProcessError(
                 returncode=result.returncode,
                 cmd=cmd,
-                output=stdout,
-                stderr=stderr,
+                output=result.stdout,
+                stderr=result.stderr,
             )
 
-        logger.debug(
-            f"Command completed: returncode={result.returncode}, "
-            f"stdout_len={len(stdout)}, stderr_len={len(stderr)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Command completed: returncode={result.returncode}, "
+                f"stdout_len={len(result.stdout_bytes)}, stderr_len={len(result.stderr_bytes)}"
+            )
 
         return result
 
@@ -127,7 +195,7 @@ async def run_async(
 async def run_shell_async(
     command: str,
     env: dict[str, str] | None = None,
-    timeout: int | None = None,
+    timeout: float | None = None,
     check: bool = False,
     capture_output: bool = True,
 ) -> AsyncCompletedProcess:
@@ -149,7 +217,8 @@ async def run_shell_async(
     Example:
         result = await run_shell_async('kubectl get pods | grep Running')
     """
-    logger.debug(f"Running async shell command: {command}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Running async shell command: {command}")
 
     try:
         # Create subprocess with pipes if capturing output
@@ -181,13 +250,12 @@ async def run_shell_async(
             logger.error(f"Shell command timed out after {timeout}s: {command}")
             raise
 
-        # Decode output
-        stdout = stdout_bytes.decode("utf-8") if stdout_bytes else ""
-        stderr = stderr_bytes.decode("utf-8") if stderr_bytes else ""
-
-        # Create result
+        # Create result (output is decoded lazily on first access)
         result = AsyncCompletedProcess(
-            args=command, returncode=process.returncode or 0, stdout=stdout, stderr=stderr
+            args=command,
+            returncode=process.returncode or 0,
+            stdout=stdout_bytes or b"",
+            stderr=stderr_bytes or b"",
         )
 
         # Check for errors if requested
@@ -197,14 +265,15 @@ async def run_shell_async(
             raise subprocess.CalledProcessError(
                 returncode=result.returncode,
                 cmd=command,
-                output=stdout,
-                stderr=stderr,
+                output=result.stdout,
+                stderr=result.stderr,
             )
 
-        logger.debug(
-            f"Shell command completed: returncode={result.returncode}, "
-            f"stdout_len={len(stdout)}, stderr_len={len(stderr)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Shell command completed: returncode={result.returncode}, "
+                f"stdout_len={len(result.stdout_bytes)}, stderr_len={len(result.stderr_bytes)}"
+            )
 
         return result
 
@@ -0,0 +1,47 @@
+"""JSON encoding and decoding backed by orjson when it is installed.
+
+kubectl and kind ``-o json`` output can run to megabytes on busy clusters, so the
+cluster modules parse it with orjson (``pip install orjson``) and fall back to the
+standard library otherwise. Both backends work on raw bytes, so subprocess output
+and state files are handled without a text decode. Decode errors are
+``json.JSONDecodeError`` either way (orjson's error subclasses it).
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    loads: Callable[[str | bytes], Any] = orjson.loads
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes.
+
+        Args:
+            obj: JSON-serializable object
+            indent: Pretty-print with two-space indentation
+
+        Returns:
+            Encoded JSON document
+        """
+        option = orjson.OPT_INDENT_2 if indent else None
+        return orjson.dumps(obj, option=option)  # type: ignore[no-any-return]
+
+except ImportError:
+    loads = json.loads
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes.
+
+        Args:
+            obj: JSON-serializable object
+            indent: Pretty-print with two-space indentation
+
+        Returns:
+            Encoded JSON document
+        """
+        if indent:
+            return json.dumps(obj, indent=2).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
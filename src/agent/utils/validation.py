@@ -2,6 +2,10 @@
 
 import re
 
+# Compiled once at import; validators run before every cluster operation
+_CLUSTER_NAME_RE = re.compile(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$")
+_K8S_VERSION_RE = re.compile(r"^v\d+\.\d+(\.\d+)?$")
+
 
 def validate_cluster_name(name: str) -> bool:
     """Validate cluster name follows Kubernetes naming conventions.
@@ -27,7 +31,7 @@ def validate_cluster_name(name: str) -> bool:
     if len(name) > 63:
         raise ValueError("Cluster name must be 63 characters or less")
 
-    if not re.match(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$", name):
+    if not _CLUSTER_NAME_RE.match(name):
         raise ValueError(
             "Cluster name must be lowercase alphanumeric with hyphens, "
             "starting and ending with alphanumeric characters"
@@ -53,7 +57,7 @@ def validate_k8s_version(version: str) -> bool:
     if not version:
         raise ValueError("Kubernetes version cannot be empty")
 
-    if not re.match(r"^v\d+\.\d+(\.\d+)?$", version):
+    if not _K8S_VERSION_RE.match(version):
         raise ValueError(
             f"Invalid Kubernetes version format: {version}. "
             "Must be in format vX.Y.Z or vX.Y (e.g., v1.34.0)"
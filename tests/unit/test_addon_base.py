@@ -189,3 +189,17 @@ async def test_run_install_failure():
     result = await addon.run()
 
     assert result["success"] is False
+
+
+def test_get_all_requirements_combines_hooks(addon):
+    """Test the default combined hook merges the individual hooks and omits empty ones."""
+    assert addon.get_all_requirements() == {}
+
+    with (
+        patch.object(addon, "get_cluster_config_requirements", return_value={"featureGates": {}}),
+        patch.object(addon, "get_node_labels", return_value={"ingress-ready": "true"}),
+    ):
+        assert addon.get_all_requirements() == {
+            "featureGates": {},
+            "node_labels": {"ingress-ready": "true"},
+        }
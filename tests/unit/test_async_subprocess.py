@@ -0,0 +1,61 @@
+"""Unit tests for async subprocess utilities."""
+
+import sys
+
+import pytest
+
+from agent.utils.async_subprocess import AsyncCompletedProcess, run_async
+
+
+class TestAsyncCompletedProcess:
+    """Tests for AsyncCompletedProcess result object."""
+
+    def test_str_output_passthrough(self):
+        """Test str output is returned unchanged."""
+        result = AsyncCompletedProcess(args=["echo"], returncode=0, stdout="out", stderr="err")
+
+        assert result.stdout == "out"
+        assert result.stderr == "err"
+        assert result.stdout_bytes == b"out"
+
+    def test_bytes_output_decoded_lazily(self):
+        """Test bytes output is decoded on first access only."""
+        result = AsyncCompletedProcess(args=["echo"], returncode=0, stdout=b"caf\xc3\xa9")
+
+        assert result.stdout_bytes == b"caf\xc3\xa9"
+        assert result.stdout == "café"
+        assert result.stdout is result.stdout
+        assert result.stderr == ""
+
+    def test_stderr_bytes_independent_of_decoding(self):
+        """Test stderr_bytes returns the same bytes before and after stderr is decoded."""
+        result = AsyncCompletedProcess(args=["echo"], returncode=1, stderr=b"caf\xc3\xa9")
+
+        assert result.stderr_bytes == b"caf\xc3\xa9"
+        assert result.stderr == "café"
+        assert result.stderr_bytes == b"caf\xc3\xa9"
+
+    def test_equality_compares_captured_output(self):
+        """Test results compare equal by value, whether output is held as str or bytes."""
+        text = AsyncCompletedProcess(args=["echo"], returncode=0, stdout="out", stderr="")
+        raw = AsyncCompletedProcess(args=["echo"], returncode=0, stdout=b"out")
+
+        assert text == raw
+        assert text != AsyncCompletedProcess(args=["echo"], returncode=1, stdout="out")
+
+
+class TestRunAsync:
+    """Tests for run_async."""
+
+    @pytest.mark.asyncio
+    async def test_run_async_captures_output(self):
+        """Test stdout and stderr are captured from a real process."""
+        result = await run_async(
+            [sys.executable, "-c", "import sys; print('hello'); print('oops', file=sys.stderr)"],
+            timeout=30,
+        )
+
+        assert result.returncode == 0
+        assert result.stdout_bytes == b"hello\n"
+        assert result.stdout.strip() == "hello"
+        assert result.stderr.strip() == "oops"
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from agent.cluster import tools
 from agent.cluster.tools import create_cluster
 from agent.config import AgentConfig
 
@@ -25,10 +26,11 @@ def setup_tools(mock_config):
         patch("agent.cluster.tools._kubectl_manager") as mock_kubectl,
         patch("agent.cluster.tools._cluster_status") as mock_status,
         patch("agent.cluster.tools._config", mock_config),
+        patch("agent.cluster.tools.Path.write_bytes"),  # cluster state file
     ):
 
         # Setup mock kind manager with async methods
-        mock_kind.create_cluster = AsyncMock(
+        mock_kind.create_cluster_from_file = AsyncMock(
             return_value={
                 "cluster_name": "test",
                 "status": "running",
@@ -36,8 +38,9 @@ def setup_tools(mock_config):
                 "kubernetes_version": "v1.34.0",
             }
         )
-        mock_kind.get_kubeconfig = AsyncMock(return_value="fake-kubeconfig")
-        mock_kind.cluster_exists = AsyncMock(return_value=False)
+        mock_kind.write_kubeconfig = AsyncMock()
+        mock_kind.list_clusters = AsyncMock(return_value=[])
+        tools._invalidate_cluster_cache()
 
         yield {
             "kind": mock_kind,
@@ -68,8 +71,8 @@ async def test_create_cluster_without_addons(mock_write, mock_mkdir, mock_get_co
 @patch("agent.cluster.tools.get_cluster_config")
 @patch("agent.cluster.tools.Path.mkdir")
 @patch("agent.cluster.tools.Path.write_text")
-@patch("agent.cluster.tools.AddonManager")
-@patch("agent.utils.port_checker.check_ingress_ports")
+@patch("agent.cluster.addons.AddonManager")
+@patch("agent.cluster.tools.check_ingress_ports")
 async def test_create_cluster_with_addons(
     mock_check_ports,
     mock_addon_manager_class,
@@ -95,9 +98,7 @@ async def test_create_cluster_with_addons(
     mock_addon_manager._validate_addon_name.return_value = "ingress"
     mock_addon_manager._alias_map = {"ingress": "ingress"}
     mock_addon_instance = MagicMock()
-    mock_addon_instance.get_cluster_config_requirements.return_value = {}
-    mock_addon_instance.get_port_requirements.return_value = []
-    mock_addon_instance.get_node_labels.return_value = {}
+    mock_addon_instance.get_all_requirements.return_value = {}
     mock_addon_manager.get_addon_instance.return_value = mock_addon_instance
 
     # Phase 2: Installation (async method)
@@ -128,8 +129,8 @@ async def test_create_cluster_with_addons(
 @patch("agent.cluster.tools.get_cluster_config")
 @patch("agent.cluster.tools.Path.mkdir")
 @patch("agent.cluster.tools.Path.write_text")
-@patch("agent.cluster.tools.AddonManager")
-@patch("agent.utils.port_checker.check_ingress_ports")
+@patch("agent.cluster.addons.AddonManager")
+@patch("agent.cluster.tools.check_ingress_ports")
 async def test_create_cluster_addon_failure(
     mock_check_ports,
     mock_addon_manager_class,
@@ -154,9 +155,7 @@ async def test_create_cluster_addon_failure(
     mock_addon_manager._validate_addon_name.return_value = "ingress"
     mock_addon_manager._alias_map = {"ingress": "ingress"}
     mock_addon_instance = MagicMock()
-    mock_addon_instance.get_cluster_config_requirements.return_value = {}
-    mock_addon_instance.get_port_requirements.return_value = []
-    mock_addon_instance.get_node_labels.return_value = {}
+    mock_addon_instance.get_all_requirements.return_value = {}
     mock_addon_manager.get_addon_instance.return_value = mock_addon_instance
 
     # Phase 2: Installation with failure (async method)
@@ -185,8 +184,8 @@ async def test_create_cluster_addon_failure(
 @patch("agent.cluster.tools.get_cluster_config")
 @patch("agent.cluster.tools.Path.mkdir")
 @patch("agent.cluster.tools.Path.write_text")
-@patch("agent.cluster.tools.AddonManager")
-@patch("agent.utils.port_checker.check_ingress_ports")
+@patch("agent.cluster.addons.AddonManager")
+@patch("agent.cluster.tools.check_ingress_ports")
 async def test_create_cluster_multiple_addons(
     mock_check_ports,
     mock_addon_manager_class,
@@ -214,9 +213,7 @@ async def test_create_cluster_multiple_addons(
     mock_addon_manager._validate_addon_name.side_effect = validate_addon_name
     mock_addon_manager._alias_map = {"ingress": "ingress", "registry": "registry"}
     mock_addon_instance = MagicMock()
-    mock_addon_instance.get_cluster_config_requirements.return_value = {}
-    mock_addon_instance.get_port_requirements.return_value = []
-    mock_addon_instance.get_node_labels.return_value = {}
+    mock_addon_instance.get_all_requirements.return_value = {}
     mock_addon_manager.get_addon_instance.return_value = mock_addon_instance
 
     # Phase 2: Installation with multiple addons (async method)
@@ -243,8 +240,8 @@ async def test_create_cluster_multiple_addons(
 @patch("agent.cluster.tools.get_cluster_config")
 @patch("agent.cluster.tools.Path.mkdir")
 @patch("agent.cluster.tools.Path.write_text")
-@patch("agent.cluster.tools.AddonManager")
-@patch("agent.utils.port_checker.check_ingress_ports")
+@patch("agent.cluster.addons.AddonManager")
+@patch("agent.cluster.tools.check_ingress_ports")
 async def test_create_cluster_addon_without_kubeconfig(
     mock_check_ports,
     mock_addon_manager_class,
@@ -268,16 +265,14 @@ async def test_create_cluster_addon_without_kubeconfig(
     mock_addon_manager._validate_addon_name.return_value = "ingress"
     mock_addon_manager._alias_map = {"ingress": "ingress"}
     mock_addon_instance = MagicMock()
-    mock_addon_instance.get_cluster_config_requirements.return_value = {}
-    mock_addon_instance.get_port_requirements.return_value = []
-    mock_addon_instance.get_node_labels.return_value = {}
+    mock_addon_instance.get_all_requirements.return_value = {}
     mock_addon_manager.get_addon_instance.return_value = mock_addon_instance
     mock_addon_manager_class.return_value = mock_addon_manager
 
     # Make kubeconfig save fail
     from agent.utils.errors import KindCommandError
 
-    mocks["kind"].get_kubeconfig.side_effect = KindCommandError("kubeconfig error")
+    mocks["kind"].write_kubeconfig.side_effect = KindCommandError("kubeconfig error")
 
     with patch("agent.cluster.tools.logger"):
         result = await create_cluster("test", "default", addons=["ingress"])
@@ -287,3 +282,198 @@ async def test_create_cluster_addon_without_kubeconfig(
 
         # But addons should not be installed (no kubeconfig for Phase 2)
         assert "addons_installed" not in result
+
+
+@pytest.mark.asyncio
+@patch("agent.cluster.tools.get_cluster_config")
+@patch("agent.cluster.tools.Path.mkdir")
+@patch("agent.cluster.tools.Path.write_text")
+@patch("agent.cluster.addons.AddonManager")
+@patch("agent.cluster.tools.merge_addon_requirements")
+async def test_create_cluster_collects_requirements_in_order(
+    mock_merge,
+    mock_addon_manager_class,
+    mock_write,
+    mock_mkdir,
+    mock_get_config,
+    setup_tools,
+):
+    """Test addon requirements keep request order and a failing addon is skipped."""
+    mock_get_config.return_value = (
+        "nodes:\n- role: control-plane\n",
+        "built-in default",
+    )
+    mock_merge.side_effect = lambda config, requirements: config
+
+    def addon_instance(name, config):
+        if name == "broken":
+            raise RuntimeError("import failed")
+        instance = MagicMock()
+        instance.get_all_requirements.return_value = {"node_labels": {"addon": name}}
+        return instance
+
+    mock_addon_manager = MagicMock()
+    mock_addon_manager.resolve_addon_name.side_effect = lambda name: name
+    mock_addon_manager.get_addon_instance.side_effect = addon_instance
+    mock_addon_manager.install_addons = AsyncMock(
+        return_value={"success": True, "results": {}, "failed": [], "message": "Addons: ok"}
+    )
+    mock_addon_manager_class.return_value = mock_addon_manager
+
+    await create_cluster("test", "default", addons=["registry", "broken", "metallb"])
+
+    requirements = mock_merge.call_args.args[1]
+    assert requirements == [
+        {"node_labels": {"addon": "registry"}},
+        {"node_labels": {"addon": "metallb"}},
+    ]
+
+
+@pytest.mark.asyncio
+@patch("agent.cluster.tools.get_cluster_config")
+@patch("agent.cluster.tools.Path.mkdir")
+@patch("agent.cluster.tools.Path.write_text")
+async def test_cluster_list_cached_until_create(
+    mock_write, mock_mkdir, mock_get_config, setup_tools
+):
+    """Test back-to-back lookups share one kind listing and create_cluster invalidates it."""
+    mocks = setup_tools
+    mock_get_config.return_value = ("fake-config", "built-in default")
+
+    assert await tools._cluster_exists("test") is False
+    assert await tools._get_cached_clusters() == []
+    assert mocks["kind"].list_clusters.await_count == 1
+
+    await create_cluster("test", "default")
+    mocks["kind"].list_clusters.return_value = ["test"]
+
+    assert await tools._cluster_exists("test") is True
+    assert mocks["kind"].list_clusters.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_clusters_finds_stopped_clusters(setup_tools, tmp_path):
+    """Test stopped clusters are data directories with state or config and no running cluster."""
+    mocks = setup_tools
+    mocks["config"].data_dir = str(tmp_path)
+    mocks["kind"].list_clusters.return_value = ["dev"]
+    clusters_dir = tmp_path / "clusters"
+    for name, data_file in [
+        ("dev", "cluster-state.json"),
+        ("old", "kind-config.yaml"),
+        ("empty", None),
+    ]:
+        (clusters_dir / name).mkdir(parents=True)
+        if data_file:
+            (clusters_dir / name / data_file).write_text("{}")
+    (clusters_dir / "notes.txt").write_text("not a cluster")
+
+    result = await tools.list_clusters()
+
+    assert result["running"] == ["dev"]
+    assert result["stopped"] == ["old"]
+    assert result["total"] == 2
+
+
+@pytest.mark.asyncio
+@patch("agent.cluster.tools.get_cluster_config")
+@patch("agent.cluster.tools.check_ingress_ports")
+@patch("agent.cluster.addons.AddonManager")
+async def test_create_cluster_ingress_port_conflict(
+    mock_addon_manager_class, mock_check_ports, mock_get_config, setup_tools
+):
+    """Test an ingress port conflict aborts creation and names each port holder."""
+    mock_get_config.return_value = ("fake-config", "built-in default")
+    mock_check_ports.return_value = {
+        "available": False,
+        "conflicting_cluster": "other",
+        "conflicts": [
+            {"port": 80, "cluster_name": "other"},
+            {"port": 443, "container": "web"},
+        ],
+    }
+
+    with patch("agent.cluster.tools.logger") as mock_logger:
+        result = await create_cluster("test", "default", addons=["ingress"])
+
+    assert result["error"] == "ingress_port_conflict"
+    assert result["conflicting_cluster"] == "other"
+    mock_addon_manager_class.assert_not_called()
+    mock_logger.warning.assert_called_once_with(
+        "Port conflict detected for ingress addon: "
+        "Port 80 is in use by Kind cluster 'other'; "
+        "Port 443 is in use by Docker container 'web'"
+    )
+    setup_tools["kind"].create_cluster_from_file.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_remove_cluster_purges_data_dir(setup_tools, tmp_path):
+    """Test purging a stopped cluster deletes its whole data directory."""
+    mocks = setup_tools
+    mocks["config"].data_dir = str(tmp_path)
+    mocks["kubectl"].forget_cluster = AsyncMock()
+    cluster_dir = mocks["config"].get_cluster_data_dir("old")
+    (cluster_dir / "logs").mkdir(parents=True)
+    (cluster_dir / "logs" / "kubelet.log").write_text("log")
+    (cluster_dir / "kind-config.yaml").write_text("kind: Cluster")
+
+    result = await tools.remove_cluster("old", purge_data=True, confirmed=True)
+
+    assert result["data_deleted"] is True
+    assert not cluster_dir.exists()
+
+
+@pytest.mark.asyncio
+async def test_cluster_state_round_trip(tmp_path):
+    """Test saved cluster state loads back unchanged and corrupt state loads as None."""
+    state = {"addons": ["ingress"], "kubernetes_version": "v1.34.0", "config_template": None}
+
+    await tools._save_cluster_state(tmp_path / "dev", state)
+
+    assert await tools._load_cluster_state(tmp_path / "dev") == state
+    (tmp_path / "dev" / "cluster-state.json").write_text("{not json")
+    assert await tools._load_cluster_state(tmp_path / "dev") is None
+    assert await tools._load_cluster_state(tmp_path / "missing") is None
+
+
+@pytest.mark.asyncio
+@patch("agent.cluster.tools.get_cluster_config")
+@patch("agent.cluster.tools.check_ingress_ports")
+async def test_port_check_reused_by_retry(mock_check_ports, mock_get_config, setup_tools):
+    """Test a retried create_cluster reuses the port check until a cluster is removed."""
+    mock_get_config.return_value = ("fake-config", "built-in default")
+    mock_check_ports.return_value = {"available": False, "conflicts": [{"port": 80}]}
+
+    with patch("agent.cluster.tools.logger"):
+        await create_cluster("test", "default", addons=["ingress"])
+        await create_cluster("test", "default", addons=["ingress"])
+        assert mock_check_ports.call_count == 1
+
+        tools._invalidate_cluster_cache()
+        await create_cluster("test", "default", addons=["ingress"])
+        assert mock_check_ports.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("agent.cluster.tools.get_cluster_config")
+async def test_create_cluster_from_snapshot_file(mock_get_config, setup_tools, tmp_path):
+    """Test kind is given the saved snapshot and a failed create removes it again."""
+    mocks = setup_tools
+    mocks["config"].data_dir = str(tmp_path)
+    mock_get_config.return_value = ("kind: Cluster\n", "built-in default")
+    cluster_dir = mocks["config"].get_cluster_data_dir("test")
+
+    await create_cluster("test", "default")
+
+    config_path = mocks["kind"].create_cluster_from_file.call_args.args[1]
+    assert config_path == cluster_dir / "kind-config.yaml"
+    assert config_path.read_text() == "kind: Cluster\n"
+
+    from agent.utils.errors import KindCommandError
+
+    mocks["kind"].create_cluster_from_file.side_effect = KindCommandError("boom")
+    result = await create_cluster("other", "default")
+
+    assert result["success"] is False
+    assert not mocks["config"].get_cluster_data_dir("other").exists()
@@ -89,3 +89,33 @@ class TestClusterConfigTemplates:
             assert parsed["name"] == "test-cluster"
             assert "nodes" in parsed
             assert len(parsed["nodes"]) > 0
+
+
+class TestParseClusterConfig:
+    """Test cached cluster configuration parsing."""
+
+    def test_parse_returns_independent_copies(self):
+        """Test mutating one parsed config does not leak into the cache."""
+        from agent.cluster.config import get_cluster_config, parse_cluster_config
+
+        content, _ = get_cluster_config("minimal", "copy-test")
+
+        first = parse_cluster_config(content)
+        first["nodes"].append({"role": "worker"})
+        second = parse_cluster_config(content)
+
+        assert len(second["nodes"]) == len(first["nodes"]) - 1
+        assert second["name"] == "copy-test"
+
+    def test_parse_is_cached_by_content(self):
+        """Test identical content is only parsed once."""
+        from agent.cluster.config import _parse_config_cached, parse_cluster_config
+
+        content = "kind: Cluster\napiVersion: kind.x-k8s.io/v1alpha4\nname: cache-test\n"
+        _parse_config_cached.cache_clear()
+
+        parse_cluster_config(content)
+        parse_cluster_config(content)
+
+        info = _parse_config_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
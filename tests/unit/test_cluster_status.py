@@ -0,0 +1,288 @@
+"""Unit tests for cluster status checks."""
+
+import json
+import os
+import subprocess
+from unittest.mock import Mock, patch
+
+import pytest
+
+from agent.cluster.status import ClusterStatus
+from agent.utils.errors import ClusterNotFoundError
+
+NODES_OUTPUT = (
+    'dev-control-plane\tTrue\tv1.34.0\t{"node-role.kubernetes.io/control-plane":""}\n'
+    'dev-worker\tFalse\tv1.34.0\t{"kubernetes.io/os":"linux"}\n'
+)
+
+
+@pytest.fixture(autouse=True)
+def tools_on_path():
+    """Resolve kubectl and helm to fake absolute paths."""
+    with patch("agent.cluster.status.shutil.which", side_effect=lambda tool: f"/usr/bin/{tool}"):
+        yield
+
+
+def fake_run(responses):
+    """Build a subprocess.run replacement keyed on (tool, verb, resource, namespace)."""
+
+    def run(cmd, **kwargs):
+        namespace = cmd[cmd.index("-n") + 1] if "-n" in cmd else None
+        key = (os.path.basename(cmd[0]), cmd[1], cmd[2], namespace)
+        returncode, stdout = responses.get(key, (1, ""))
+        return Mock(returncode=returncode, stdout=stdout.encode(), stderr=b"")
+
+    return run
+
+
+class TestClusterStatus:
+    """Tests for ClusterStatus class."""
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_get_cluster_status_aggregates_probes(self, mock_run):
+        """Test status combines nodes, usage and addons from concurrent probes."""
+        mock_run.side_effect = fake_run(
+            {
+                ("kubectl", "get", "nodes", None): (0, NODES_OUTPUT),
+                ("kubectl", "top", "nodes", None): (0, "dev-control-plane 100m 5% 512Mi 10%"),
+                ("helm", "list", "--namespace", None): (
+                    0,
+                    json.dumps([{"name": "ingress-nginx", "app_version": "1.9.0"}]),
+                ),
+                ("kubectl", "get", "deployments", "kube-system"): (0, "coredns metrics-server"),
+            }
+        )
+
+        status = ClusterStatus().get_cluster_status("dev")
+
+        assert status["total_nodes"] == 2
+        assert status["ready_nodes"] == 1
+        assert status["nodes"][0]["role"] == "control-plane"
+        assert status["nodes"][1] == {
+            "name": "dev-worker",
+            "role": "worker",
+            "ready": False,
+            "version": "v1.34.0",
+            "status": "NotReady",
+        }
+        assert status["resource_usage"]["nodes"][0]["cpu_percent"] == "5%"
+        assert status["addons"]["ingress-nginx"]["method"] == "helm"
+        assert status["addons"]["metrics-server"]["method"] == "kubectl"
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_get_cluster_status_not_found(self, mock_run):
+        """Test a cluster with no reachable nodes raises ClusterNotFoundError."""
+        mock_run.side_effect = fake_run({})
+
+        with pytest.raises(ClusterNotFoundError):
+            ClusterStatus().get_cluster_status("missing")
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_detect_addons_ingress_namespace(self, mock_run):
+        """Test per-namespace fallback finds ingress-nginx in its own namespace."""
+        mock_run.side_effect = fake_run(
+            {
+                ("kubectl", "get", "deployments", "ingress-nginx"): (0, "controller"),
+            }
+        )
+
+        addons = ClusterStatus().detect_addons("dev")
+
+        assert addons == {
+            "ingress-nginx": {"installed": True, "method": "kubectl", "namespace": "ingress-nginx"}
+        }
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_check_cluster_health_counts_pod_phases(self, mock_run):
+        """Test system pod health is computed from jsonpath-projected phases."""
+        mock_run.side_effect = fake_run(
+            {
+                ("kubectl", "get", "nodes", None): (0, NODES_OUTPUT),
+                ("kubectl", "get", "pods", "kube-system"): (0, "Running Succeeded Pending"),
+            }
+        )
+
+        health = ClusterStatus().check_cluster_health("dev")
+
+        pods_check = next(c for c in health["checks"] if c["name"] == "system_pods")
+        assert pods_check["status"] == "warn"
+        assert pods_check["message"] == "2/3 system pods running"
+        assert health["healthy"] is False
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_node_status_reused_between_status_and_health(self, mock_run):
+        """Test back-to-back status and health checks share one node probe."""
+        mock_run.side_effect = fake_run({("kubectl", "get", "nodes", None): (0, NODES_OUTPUT)})
+        checker = ClusterStatus()
+
+        checker.get_cluster_status("dev")
+        checker.check_cluster_health("dev")
+
+        node_calls = [c for c in mock_run.call_args_list if c.args[0][1:3] == ["get", "nodes"]]
+        assert len(node_calls) == 1
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_failed_node_probe_not_cached(self, mock_run):
+        """Test an empty (failed) node probe is retried on the next call."""
+        mock_run.side_effect = fake_run({})
+        checker = ClusterStatus()
+
+        checker.check_cluster_health("dev")
+        checker.check_cluster_health("dev")
+
+        node_calls = [c for c in mock_run.call_args_list if c.args[0][1:3] == ["get", "nodes"]]
+        assert len(node_calls) == 2
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_detect_addons_single_deployment_listing(self, mock_run):
+        """Test addon deployments are found with one cluster-wide kubectl call."""
+        mock_run.side_effect = fake_run(
+            {
+                ("kubectl", "get", "deployments", None): (
+                    0,
+                    "kube-system\tcoredns\nkube-system\tmetrics-server\ningress-nginx\tcontroller\n",
+                ),
+            }
+        )
+
+        addons = ClusterStatus().detect_addons("dev")
+
+        assert addons["metrics-server"] == {"installed": True, "method": "kubectl"}
+        assert addons["ingress-nginx"]["namespace"] == "ingress-nginx"
+        kubectl_calls = [c for c in mock_run.call_args_list if c.args[0][0] == "/usr/bin/kubectl"]
+        assert len(kubectl_calls) == 1
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_missing_helm_is_not_spawned(self, mock_run):
+        """Test detect_addons skips helm entirely when it is not installed."""
+        mock_run.side_effect = fake_run({})
+
+        with patch(
+            "agent.cluster.status.shutil.which", side_effect={"kubectl": "/usr/bin/kubectl"}.get
+        ):
+            checker = ClusterStatus()
+        checker.detect_addons("dev")
+
+        assert all(c.args[0][0] == "/usr/bin/kubectl" for c in mock_run.call_args_list)
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_get_resource_usage_parses_rows(self, mock_run):
+        """Test kubectl top rows are parsed and short rows are skipped."""
+        mock_run.side_effect = fake_run(
+            {
+                ("kubectl", "top", "nodes", None): (
+                    0,
+                    "dev-control-plane   250m   6%   900Mi   11%\nbroken 1m\ndev-worker 50m 1% 300Mi 4%\n",
+                ),
+            }
+        )
+
+        usage = ClusterStatus().get_resource_usage("dev")
+
+        assert usage is not None
+        assert [n["name"] for n in usage["nodes"]] == ["dev-control-plane", "dev-worker"]
+        assert usage["nodes"][0]["memory_percent"] == "11%"
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_helm_skipped_without_saved_kubeconfig(self, mock_run, mock_config, tmp_path):
+        """Test the helm probe is skipped when the cluster has no saved kubeconfig."""
+        mock_run.side_effect = fake_run({})
+        mock_config.data_dir = str(tmp_path)
+
+        ClusterStatus(mock_config).detect_addons("dev")
+
+        assert not any(c.args[0][0] == "/usr/bin/helm" for c in mock_run.call_args_list)
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_saved_kubeconfig_replaces_context(self, mock_run, mock_config, tmp_path):
+        """Test probes target the saved kubeconfig instead of the kind context."""
+        mock_run.side_effect = fake_run({("kubectl", "get", "nodes", None): (0, NODES_OUTPUT)})
+        mock_config.data_dir = str(tmp_path)
+        kubeconfig = mock_config.get_kubeconfig_path("dev")
+        kubeconfig.parent.mkdir(parents=True)
+        kubeconfig.write_text("apiVersion: v1\n")
+
+        ClusterStatus(mock_config).get_node_status("dev")
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[cmd.index("--kubeconfig") + 1] == str(kubeconfig)
+        assert "--context" not in cmd
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_detect_addons_all_from_helm(self, mock_run):
+        """Test Helm release names are matched for every known addon."""
+        releases = [
+            {"name": "cert-manager", "chart": "cert-manager-1.0"},
+            {"name": "nginx-ingress", "app_version": "1.9.0", "chart": "ingress-nginx-4.8"},
+            {"name": "metrics-server", "app_version": "0.7.0", "chart": "metrics-server-3.12"},
+        ]
+        mock_run.side_effect = fake_run(
+            {("helm", "list", "--namespace", None): (0, json.dumps(releases))}
+        )
+
+        addons = ClusterStatus().detect_addons("dev")
+
+        assert addons["ingress-nginx"]["chart"] == "ingress-nginx-4.8"
+        assert addons["metrics-server"]["version"] == "0.7.0"
+        assert all(a["method"] == "helm" for a in addons.values())
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_legacy_master_label_is_control_plane(self, mock_run):
+        """Test the pre-1.20 master role label still marks a control-plane node."""
+        output = 'old-master\tTrue\tv1.19.0\t{"node-role.kubernetes.io/master":""}\nbare\tTrue\tv1.19.0\t\n'
+        mock_run.side_effect = fake_run({("kubectl", "get", "nodes", None): (0, output)})
+
+        nodes = ClusterStatus().get_node_status("old")
+
+        assert [(n["name"], n["role"]) for n in nodes] == [
+            ("old-master", "control-plane"),
+            ("bare", "worker"),
+        ]
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_control_plane_detected_from_parsed_labels(self, mock_run):
+        """Test roles come from the label keys, whatever spacing kubectl prints the map with."""
+        output = (
+            'kind-control-plane\tTrue\tv1.34.0\t{"beta.kubernetes.io/arch":"amd64",'
+            '"kubernetes.io/hostname":"kind-control-plane",'
+            '"node-role.kubernetes.io/control-plane":"",'
+            '"node.kubernetes.io/exclude-from-external-load-balancers":""}\n'
+            'spaced\tTrue\tv1.34.0\t{"node-role.kubernetes.io/control-plane": ""}\n'
+            'kind-worker\tTrue\tv1.34.0\t{"kubernetes.io/hostname":"node-role.kubernetes.io/master"}\n'
+        )
+        mock_run.side_effect = fake_run({("kubectl", "get", "nodes", None): (0, output)})
+
+        nodes = ClusterStatus().get_node_status("kind")
+
+        assert [(n["name"], n["role"]) for n in nodes] == [
+            ("kind-control-plane", "control-plane"),
+            ("spaced", "control-plane"),
+            ("kind-worker", "worker"),
+        ]
+
+    def test_close_shuts_down_probe_pool(self):
+        """Test close releases the probe worker threads."""
+        checker = ClusterStatus()
+
+        checker.close()
+
+        with pytest.raises(RuntimeError):
+            checker._executor.submit(print)
+
+    @patch("agent.cluster.status.subprocess.run")
+    def test_check_cluster_health_pod_probe_timeout(self, mock_run):
+        """Test a timed-out pod probe is reported while node results are still used."""
+        node_run = fake_run({("kubectl", "get", "nodes", None): (0, NODES_OUTPUT)})
+
+        def run(cmd, **kwargs):
+            if cmd[1:3] == ["get", "pods"]:
+                raise subprocess.TimeoutExpired(cmd, 10)
+            return node_run(cmd, **kwargs)
+
+        mock_run.side_effect = run
+
+        health = ClusterStatus().check_cluster_health("dev")
+
+        assert [c["name"] for c in health["checks"]] == ["nodes", "system_pods"]
+        assert health["checks"][0]["message"] == "1/2 nodes ready"
+        assert health["checks"][1]["message"] == "Could not check system pods"
@@ -22,6 +22,22 @@ class TestAgentConfig:
             assert config.cluster_prefix == "butler-"
             assert config.default_k8s_version == "v1.34.0"
             assert config.log_level == "info"
+            assert config.kubectl_proxy is False
+            assert config.kubectl_max_concurrency == 8
+
+    def test_kubectl_proxy_from_environment(self):
+        """Test kubectl proxy mode can be enabled from environment."""
+        with patch.dict(os.environ, {"BUTLER_KUBECTL_PROXY": "true"}, clear=True):
+            config = AgentConfig()
+
+            assert config.kubectl_proxy is True
+
+    def test_kubectl_max_concurrency_from_environment(self):
+        """Test the kubectl process cap is read from environment and kept at least 1."""
+        with patch.dict(os.environ, {"BUTLER_KUBECTL_MAX_CONCURRENCY": "3"}, clear=True):
+            assert AgentConfig().kubectl_max_concurrency == 3
+        with patch.dict(os.environ, {"BUTLER_KUBECTL_MAX_CONCURRENCY": "0"}, clear=True):
+            assert AgentConfig().kubectl_max_concurrency == 1
 
     def test_environment_variable_loading_azure(self):
         """Test loading Azure OpenAI configuration from environment."""
@@ -92,6 +108,21 @@ class TestAgentConfig:
             with pytest.raises(ValueError, match="OpenAI API key is required"):
                 config.validate()
 
+    def test_validation_failure_invalid_kubectl_max_concurrency(self):
+        """Test a non-integer kubectl process cap keeps the default and fails validation."""
+        env = {
+            "LLM_PROVIDER": "openai",
+            "OPENAI_API_KEY": "sk-test",
+            "BUTLER_KUBECTL_MAX_CONCURRENCY": "eight",
+        }
+
+        with patch.dict(os.environ, env, clear=True):
+            config = AgentConfig()
+
+            assert config.kubectl_max_concurrency == 8
+            with pytest.raises(ValueError, match="BUTLER_KUBECTL_MAX_CONCURRENCY"):
+                config.validate()
+
     def test_get_cluster_data_dir(self):
         """Test getting cluster data directory path."""
         with patch.dict(os.environ, {"BUTLER_DATA_DIR": "/tmp/test"}, clear=True):
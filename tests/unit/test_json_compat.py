@@ -0,0 +1,30 @@
+"""Unit tests for the orjson-backed JSON helpers."""
+
+import json
+
+import pytest
+
+from agent.utils import json_compat
+
+
+class TestJsonCompat:
+    """Test loads/dumps behave the same with either backend."""
+
+    def test_round_trip_bytes(self):
+        """Test bytes produced by dumps are read back by loads."""
+        data = {"name": "dev", "nodes": [1, 2], "ready": True}
+
+        assert json_compat.loads(json_compat.dumps(data)) == data
+        assert json_compat.loads(json.dumps(data).encode("utf-8")) == data
+
+    def test_dumps_indent(self):
+        """Test pretty output uses two-space indentation."""
+        encoded = json_compat.dumps({"a": 1}, indent=True)
+
+        assert isinstance(encoded, bytes)
+        assert encoded == b'{\n  "a": 1\n}'
+
+    def test_loads_invalid_raises_json_decode_error(self):
+        """Test malformed input raises the stdlib decode error."""
+        with pytest.raises(json.JSONDecodeError):
+            json_compat.loads(b"{not json")
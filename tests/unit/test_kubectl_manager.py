@@ -1,9 +1,12 @@
 """Unit tests for kubectl manager."""
 
+import asyncio
 import json
+import os
 import subprocess
+import time
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, mock_open, patch
 
 import pytest
 
@@ -67,6 +70,28 @@ class TestKubectlManager:
         expected_path = mock_config.get_kubeconfig_path("test-cluster")
         assert path == expected_path
 
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.shutil.which")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_run_kubectl_uses_resolved_binary(
+        self, mock_run, mock_which, mock_run_async, mock_config
+    ):
+        """Test kubectl is exec'd by absolute path resolved once at init."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        mock_which.return_value = "/usr/local/bin/kubectl"
+        manager = KubectlManager(mock_config)
+
+        mock_run_async.return_value = AsyncCompletedProcess(
+            args=["kubectl", "get", "pods"], returncode=0, stdout="", stderr=""
+        )
+
+        await manager._run_kubectl(["get", "pods"], Path("/tmp/kubeconfig"))
+        await manager._run_kubectl(["get", "nodes"], Path("/tmp/kubeconfig"))
+
+        assert mock_run_async.call_args[0][0][0] == "/usr/local/bin/kubectl"
+        mock_which.assert_called_once_with("kubectl")
+
     @pytest.mark.asyncio
     @patch("agent.cluster.kubectl_manager.run_async")
     @patch("agent.cluster.kubectl_manager.subprocess.run")
@@ -267,6 +292,93 @@ class TestKubectlManager:
 
             assert "Failed to get" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_get_resources_multi(self, mock_run, mock_run_async, mock_config):
+        """Test several resource types are fetched with one kubectl call."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        resources_data = {
+            "kind": "List",
+            "items": [
+                {"kind": "Pod", "metadata": {"name": "pod-1"}},
+                {"kind": "Service", "metadata": {"name": "svc-1"}},
+                {"kind": "Pod", "metadata": {"name": "pod-2"}},
+            ],
+        }
+
+        mock_run_async.side_effect = [
+            AsyncCompletedProcess(
+                args=["kubectl", "cluster-info"],
+                returncode=0,
+                stdout="cluster info",
+                stderr="",
+            ),
+            AsyncCompletedProcess(
+                args=["kubectl", "get", "pods,services"],
+                returncode=0,
+                stdout=json.dumps(resources_data),
+                stderr="",
+            ),
+        ]
+
+        with patch.object(Path, "exists", return_value=True):
+            result = await manager.get_resources_multi("test-cluster", ["pods", "services"])
+
+        assert mock_run_async.call_count == 2
+        assert "pods,services" in mock_run_async.call_args[0][0]
+        assert result["count"] == 3
+        assert len(result["resources"]["Pod"]) == 2
+        assert len(result["resources"]["Service"]) == 1
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_get_resources_multi_reports_failures_per_type(
+        self, mock_run, mock_run_async, mock_config
+    ):
+        """Test a failing type is reported on its own while the others are returned."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        pods = {"kind": "PodList", "items": [{"kind": "Pod", "metadata": {"name": "pod-1"}}]}
+
+        async def run(cmd, **kwargs):
+            if "cluster-info" in cmd:
+                return AsyncCompletedProcess(args=cmd, returncode=0)
+            if "pods" in cmd:
+                return AsyncCompletedProcess(args=cmd, returncode=0, stdout=json.dumps(pods))
+            return AsyncCompletedProcess(
+                args=cmd,
+                returncode=1,
+                stderr='error: the server doesn\'t have a resource type "widgets"',
+            )
+
+        mock_run_async.side_effect = run
+
+        with patch.object(Path, "exists", return_value=True):
+            result = await manager.get_resources_multi("test-cluster", ["pods", "widgets"])
+
+            assert result["count"] == 1
+            assert result["resources"]["Pod"][0]["metadata"]["name"] == "pod-1"
+            assert list(result["errors"]) == ["widgets"]
+            assert "widgets" in result["errors"]["widgets"]
+
+            with pytest.raises(KubectlCommandError):
+                await manager.get_resources_multi("test-cluster", ["gadgets", "widgets"])
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_get_resources_multi_requires_types(self, mock_run, mock_config):
+        """Test an empty type list is rejected before spawning kubectl."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        with pytest.raises(ValueError):
+            await manager.get_resources_multi("test-cluster", [])
+
     @pytest.mark.asyncio
     @patch("agent.cluster.kubectl_manager.run_async")
     @patch("agent.cluster.kubectl_manager.subprocess.run")
@@ -340,6 +452,8 @@ metadata:
                 await manager.apply_manifest("test-cluster", invalid_manifest)
 
             assert "Invalid YAML" in str(exc_info.value)
+        # Malformed input is rejected before any cluster round-trip
+        mock_run_async.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("agent.cluster.kubectl_manager.run_async")
@@ -404,6 +518,36 @@ metadata:
         assert result["deleted"] is False
         assert "not found" in result["message"]
 
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_delete_resource_not_found_server_error(
+        self, mock_run, mock_run_async, mock_config
+    ):
+        """Test CamelCase NotFound server errors are treated as already deleted."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        mock_run_async.side_effect = [
+            AsyncCompletedProcess(
+                args=["kubectl", "cluster-info"],
+                returncode=0,
+                stdout="cluster info",
+                stderr="",
+            ),
+            AsyncCompletedProcess(
+                args=["kubectl", "delete", "pod", "gone"],
+                returncode=1,
+                stdout="",
+                stderr="Error from server (NotFound): pods gone",
+            ),
+        ]
+
+        with patch.object(Path, "exists", return_value=True):
+            result = await manager.delete_resource("test-cluster", "pod", "gone")
+
+        assert result["deleted"] is False
+
     @pytest.mark.asyncio
     @patch("agent.cluster.kubectl_manager.run_async")
     @patch("agent.cluster.kubectl_manager.subprocess.run")
@@ -604,3 +748,665 @@ Events:       <none>
 
             assert "nginx" in str(exc_info.value)
             assert "not found" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.asyncio.create_subprocess_exec")
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_stream_logs_yields_lines(self, mock_run, mock_run_async, mock_exec, mock_config):
+        """Test log streaming yields lines from a single follow process."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        mock_run_async.return_value = AsyncCompletedProcess(
+            args=["kubectl", "cluster-info"],
+            returncode=0,
+            stdout="cluster info",
+            stderr="",
+        )
+
+        stdout = asyncio.StreamReader()
+        stdout.feed_data(b"line 1\nline 2\n")
+        stdout.feed_eof()
+        process = Mock(stdout=stdout, stderr=asyncio.StreamReader(), returncode=None)
+
+        async def finish():
+            process.returncode = 0
+
+        process.wait = AsyncMock(side_effect=finish)
+        mock_exec.return_value = process
+
+        with patch.object(Path, "exists", return_value=True):
+            lines = [line async for line in manager.stream_logs("test-cluster", "test-pod")]
+
+        assert lines == ["line 1", "line 2"]
+        cmd = mock_exec.call_args[0]
+        assert "--follow" in cmd
+        assert "--tail=100" in cmd
+        process.terminate.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.asyncio.create_subprocess_exec")
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_stream_logs_splits_overlong_lines(
+        self, mock_run, mock_run_async, mock_exec, mock_config
+    ):
+        """Test lines longer than the reader limit are yielded in pieces, not raised."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        mock_run_async.return_value = AsyncCompletedProcess(
+            args=["kubectl", "cluster-info"],
+            returncode=0,
+            stdout="cluster info",
+            stderr="",
+        )
+
+        stdout = asyncio.StreamReader(limit=8)
+        stdout.feed_data(b"short\n" + b"x" * 12 + b"\nend\n")
+        stdout.feed_eof()
+        stderr = asyncio.StreamReader()
+        stderr.feed_eof()
+        process = Mock(stdout=stdout, stderr=stderr, returncode=None)
+
+        async def finish():
+            process.returncode = 0
+
+        process.wait = AsyncMock(side_effect=finish)
+        mock_exec.return_value = process
+
+        with patch.object(Path, "exists", return_value=True):
+            lines = [line async for line in manager.stream_logs("test-cluster", "test-pod")]
+
+        assert "".join(lines[1:-1]) == "x" * 12
+        assert lines[0] == "short"
+        assert lines[-1] == "end"
+        assert mock_exec.call_args.kwargs["limit"] > 64 * 1024
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.asyncio.create_subprocess_exec")
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_stream_logs_reports_stderr_tail(
+        self, mock_run, mock_run_async, mock_exec, mock_config
+    ):
+        """Test a failed follow process reports the stderr drained alongside stdout."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        mock_run_async.return_value = AsyncCompletedProcess(
+            args=["kubectl", "cluster-info"],
+            returncode=0,
+            stdout="cluster info",
+            stderr="",
+        )
+
+        stdout = asyncio.StreamReader()
+        stdout.feed_eof()
+        stderr = asyncio.StreamReader()
+        stderr.feed_data(b'Error from server (NotFound): pods "test-pod" not found')
+        stderr.feed_eof()
+        process = Mock(stdout=stdout, stderr=stderr, returncode=None)
+
+        async def finish():
+            process.returncode = 1
+
+        process.wait = AsyncMock(side_effect=finish)
+        mock_exec.return_value = process
+
+        with patch.object(Path, "exists", return_value=True):
+            with pytest.raises(ResourceNotFoundError):
+                async for _ in manager.stream_logs("test-cluster", "test-pod"):
+                    pass
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.asyncio.create_subprocess_exec")
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_stream_logs_terminates_on_close(
+        self, mock_run, mock_run_async, mock_exec, mock_config
+    ):
+        """Test closing the stream terminates the follow process."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        mock_run_async.return_value = AsyncCompletedProcess(
+            args=["kubectl", "cluster-info"],
+            returncode=0,
+            stdout="cluster info",
+            stderr="",
+        )
+
+        stdout = asyncio.StreamReader()
+        stdout.feed_data(b"line 1\n")
+        process = Mock(stdout=stdout, stderr=asyncio.StreamReader(), returncode=None)
+        process.wait = AsyncMock()
+        mock_exec.return_value = process
+
+        with patch.object(Path, "exists", return_value=True):
+            stream = manager.stream_logs("test-cluster", "test-pod")
+            assert await anext(stream) == "line 1"
+            await stream.aclose()
+
+        process.terminate.assert_called_once()
+        process.wait.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_apply_manifest_multi_document(self, mock_run, mock_run_async, mock_config):
+        """Test multi-document manifests pass validation."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        mock_run_async.side_effect = [
+            AsyncCompletedProcess(
+                args=["kubectl", "cluster-info"],
+                returncode=0,
+                stdout="cluster info",
+                stderr="",
+            ),
+            AsyncCompletedProcess(
+                args=["kubectl", "apply"],
+                returncode=0,
+                stdout="namespace/apps created\nconfigmap/settings created\n",
+                stderr="",
+            ),
+        ]
+
+        manifest = """
+apiVersion: v1
+kind: Namespace
+metadata:
+  name: apps
+---
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: settings
+"""
+
+        with patch.object(Path, "exists", return_value=True):
+            result = await manager.apply_manifest("test-cluster", manifest)
+
+        assert result["resources"] == ["namespace/apps created", "configmap/settings created"]
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.asyncio.create_subprocess_exec")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_get_proxy_port_reuses_process(self, mock_run, mock_exec, mock_config):
+        """Test the kubectl proxy is started once per cluster and its port parsed."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        stdout = asyncio.StreamReader()
+        stdout.feed_data(b"Starting to serve on 127.0.0.1:40123\n")
+        process = Mock(stdout=stdout, returncode=None)
+        process.wait = AsyncMock()
+        mock_exec.return_value = process
+
+        kubeconfig = Path("/tmp/kubeconfig")
+        assert await manager._get_proxy_port("test-cluster", kubeconfig) == 40123
+        assert await manager._get_proxy_port("test-cluster", kubeconfig) == 40123
+        mock_exec.assert_called_once()
+        assert "--port=0" in mock_exec.call_args[0]
+
+        await manager.stop_proxy("test-cluster")
+        process.terminate.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.asyncio.create_subprocess_exec")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_slow_proxy_start_does_not_block_other_clusters(
+        self, mock_run, mock_exec, mock_config
+    ):
+        """Test a hung proxy start only blocks its own cluster and honours the deadline."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        hung = Mock(stdout=asyncio.StreamReader(), returncode=None)
+        hung.wait = AsyncMock()
+        ready_stdout = asyncio.StreamReader()
+        ready_stdout.feed_data(b"Starting to serve on 127.0.0.1:40123\n")
+        ready = Mock(stdout=ready_stdout, returncode=None)
+        ready.wait = AsyncMock()
+        mock_exec.side_effect = [hung, ready]
+
+        kubeconfig = Path("/tmp/kubeconfig")
+        slow = asyncio.create_task(
+            manager._get_proxy_port("slow", kubeconfig, deadline=time.monotonic() + 0.2)
+        )
+        await asyncio.sleep(0)
+
+        assert await asyncio.wait_for(manager._get_proxy_port("fast", kubeconfig), 0.1) == 40123
+        assert not slow.done()
+        assert await slow is None
+        hung.terminate.assert_called_once()
+
+        await manager.close()
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_get_resources_via_proxy(self, mock_run, mock_run_async, mock_config):
+        """Test get_resources serves from the proxy without spawning kubectl."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        mock_config.kubectl_proxy = True
+        manager = KubectlManager(mock_config)
+
+        pods = {"kind": "PodList", "items": [{"kind": "Pod", "metadata": {"name": "web"}}]}
+        with patch.object(manager, "_proxy_list", AsyncMock(return_value=pods)):
+            result = await manager.get_resources("test-cluster", "pods", label_selector="app=web")
+
+        assert result["count"] == 1
+        assert result["resources"][0]["metadata"]["name"] == "web"
+        mock_run_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_get_resources_proxy_fallback(self, mock_run, mock_run_async, mock_config):
+        """Test get_resources falls back to kubectl when the proxy is unavailable."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        mock_config.kubectl_proxy = True
+        manager = KubectlManager(mock_config)
+
+        mock_run_async.side_effect = [
+            AsyncCompletedProcess(
+                args=["kubectl", "cluster-info"],
+                returncode=0,
+                stdout="cluster info",
+                stderr="",
+            ),
+            AsyncCompletedProcess(
+                args=["kubectl", "get"],
+                returncode=0,
+                stdout=json.dumps({"items": [{"metadata": {"name": "web"}}]}),
+                stderr="",
+            ),
+        ]
+
+        with (
+            patch.object(manager, "_proxy_list", AsyncMock(return_value=None)),
+            patch.object(Path, "exists", return_value=True),
+        ):
+            result = await manager.get_resources("test-cluster", "widgets")
+
+        assert result["count"] == 1
+        assert mock_run_async.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_run_kubectl_bounded_per_cluster(self, mock_run, mock_run_async, mock_config):
+        """Test concurrent kubectl calls against one cluster are capped."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        running = 0
+        peak = 0
+
+        async def fake_run(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return AsyncCompletedProcess(args=["kubectl"], returncode=0)
+
+        mock_run_async.side_effect = fake_run
+
+        kubeconfig = Path("/tmp/kubeconfig")
+        await asyncio.gather(
+            *(manager._run_kubectl(["get", "pods"], kubeconfig) for _ in range(10))
+        )
+
+        assert mock_run_async.call_count == 10
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_run_kubectl_bounded_across_clusters(self, mock_run, mock_run_async, mock_config):
+        """Test the process-wide cap applies across different clusters."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        mock_config.kubectl_max_concurrency = 3
+        manager = KubectlManager(mock_config)
+
+        running = 0
+        peak = 0
+
+        async def fake_run(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return AsyncCompletedProcess(args=["kubectl"], returncode=0)
+
+        mock_run_async.side_effect = fake_run
+
+        await asyncio.gather(
+            *(
+                manager._run_kubectl(["get", "pods"], Path(f"/tmp/kubeconfig-{i}"))
+                for i in range(10)
+            )
+        )
+
+        assert mock_run_async.call_count == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_get_logs_trailing_newline(self, mock_run, mock_run_async, mock_config):
+        """Test a trailing newline does not count as an extra log line."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        mock_run_async.side_effect = [
+            AsyncCompletedProcess(
+                args=["kubectl", "cluster-info"],
+                returncode=0,
+                stdout="cluster info",
+                stderr="",
+            ),
+            AsyncCompletedProcess(
+                args=["kubectl", "logs", "test-pod"],
+                returncode=0,
+                stdout="log line 1\nlog line 2\n",
+                stderr="",
+            ),
+        ]
+
+        with patch.object(Path, "exists", return_value=True):
+            result = await manager.get_logs("test-cluster", "test-pod")
+
+        assert result["lines"] == 2
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_deadline_clamps_and_expires(self, mock_run, mock_run_async, mock_config):
+        """Test a deadline clamps kubectl timeouts and rejects expired calls."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        mock_run_async.return_value = AsyncCompletedProcess(args=["kubectl"], returncode=0)
+        kubeconfig = Path("/tmp/kubeconfig")
+
+        await manager._run_kubectl(["apply"], kubeconfig, timeout=60, deadline=time.monotonic() + 5)
+        assert mock_run_async.call_args.kwargs["timeout"] <= 5
+
+        with pytest.raises(KubectlCommandError) as exc_info:
+            await manager._run_kubectl(["apply"], kubeconfig, deadline=time.monotonic() - 1)
+
+        assert "Deadline exceeded" in str(exc_info.value)
+        assert mock_run_async.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_cluster_slots_dropped_when_idle(self, mock_run, mock_run_async, mock_config):
+        """Test per-cluster semaphores only exist while kubectl calls are running or queued."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+        release = asyncio.Event()
+
+        async def run(cmd, **kwargs):
+            await release.wait()
+            return AsyncCompletedProcess(args=cmd, returncode=0)
+
+        mock_run_async.side_effect = run
+        kubeconfig = mock_config.get_kubeconfig_path("test-cluster")
+
+        calls = [
+            asyncio.create_task(manager._run_kubectl(["get", "pods"], kubeconfig)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        assert manager._cluster_slots[str(kubeconfig)].users == 2
+
+        release.set()
+        await asyncio.gather(*calls)
+        assert manager._cluster_slots == {}
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_deadline_counts_time_queued_for_a_slot(
+        self, mock_run, mock_run_async, mock_config
+    ):
+        """Test a call that waits past its deadline for a kubectl slot is rejected."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+        manager._kubectl_slots = asyncio.Semaphore(1)
+
+        mock_run_async.return_value = AsyncCompletedProcess(args=["kubectl"], returncode=0)
+        kubeconfig = Path("/tmp/kubeconfig")
+
+        async with manager._kubectl_slots:
+            call = asyncio.create_task(
+                manager._run_kubectl(["get", "pods"], kubeconfig, deadline=time.monotonic() + 0.05)
+            )
+            await asyncio.sleep(0.1)
+
+        with pytest.raises(KubectlCommandError, match="Deadline exceeded"):
+            await call
+        mock_run_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_validate_kubeconfig_reuses_recent_check(
+        self, mock_run, mock_run_async, mock_config, tmp_path
+    ):
+        """Test cluster-info runs once until the kubeconfig changes or the cluster is forgotten."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        mock_config.data_dir = str(tmp_path)
+        manager = KubectlManager(mock_config)
+        kubeconfig = mock_config.get_kubeconfig_path("test-cluster")
+        kubeconfig.parent.mkdir(parents=True)
+        kubeconfig.write_text("apiVersion: v1\n")
+
+        mock_run_async.return_value = AsyncCompletedProcess(
+            args=["kubectl", "cluster-info"], returncode=0
+        )
+
+        await manager._validate_kubeconfig("test-cluster")
+        await manager._validate_kubeconfig("test-cluster")
+        assert mock_run_async.call_count == 1
+
+        os.utime(kubeconfig, ns=(0, 0))
+        await manager._validate_kubeconfig("test-cluster")
+        assert mock_run_async.call_count == 2
+
+        await manager.forget_cluster("test-cluster")
+        await manager._validate_kubeconfig("test-cluster")
+        assert mock_run_async.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_unreachable_cluster_drops_cached_validation(
+        self, mock_run, mock_run_async, mock_config, tmp_path
+    ):
+        """Test a refused connection makes the next call re-run cluster-info."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        mock_config.data_dir = str(tmp_path)
+        manager = KubectlManager(mock_config)
+        kubeconfig = mock_config.get_kubeconfig_path("test-cluster")
+        kubeconfig.parent.mkdir(parents=True)
+        kubeconfig.write_text("apiVersion: v1\n")
+
+        mock_run_async.side_effect = [
+            AsyncCompletedProcess(args=["kubectl", "cluster-info"], returncode=0),
+            AsyncCompletedProcess(
+                args=["kubectl", "get", "pods"],
+                returncode=1,
+                stderr="The connection to the server 127.0.0.1:6443 was refused - "
+                "did you specify the right host or port?",
+            ),
+            AsyncCompletedProcess(args=["kubectl", "cluster-info"], returncode=1),
+        ]
+
+        with pytest.raises(KubectlCommandError):
+            await manager.get_resources("test-cluster", "pods")
+        with pytest.raises(ClusterNotFoundError):
+            await manager.get_resources("test-cluster", "pods")
+
+        assert mock_run_async.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_proxy_list_follows_continue_tokens(self, mock_run, mock_config):
+        """Test proxy listing pages with limit/continue and merges every page."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+
+        pages = [
+            {
+                "kind": "PodList",
+                "apiVersion": "v1",
+                "metadata": {"continue": "next"},
+                "items": [{"metadata": {"name": "a"}}],
+            },
+            {
+                "kind": "PodList",
+                "apiVersion": "v1",
+                "metadata": {},
+                "items": [{"metadata": {"name": "b"}}],
+            },
+        ]
+        requests = []
+
+        def get(url, params, timeout):
+            requests.append(dict(params))
+            response = MagicMock(status=200)
+            response.read = AsyncMock(return_value=json.dumps(pages[len(requests) - 1]).encode())
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=False)
+            return context
+
+        manager._http = Mock(closed=False, get=get)
+        with (
+            patch.object(manager, "_get_proxy_port", AsyncMock(return_value=40123)),
+            patch.object(Path, "exists", return_value=True),
+        ):
+            data = await manager._proxy_list("test-cluster", "pods", "default", "app=web")
+
+        assert [item["metadata"]["name"] for item in data["items"]] == ["a", "b"]
+        assert data["items"][1]["kind"] == "Pod"
+        assert requests == [
+            {"limit": "500", "labelSelector": "app=web"},
+            {"limit": "500", "labelSelector": "app=web", "continue": "next"},
+        ]
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_get_logs_through_proxy(self, mock_run, mock_run_async, mock_config):
+        """Test logs come from the proxied log subresource without spawning kubectl."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+        manager._use_proxy = True
+        requests = []
+
+        def get(url, params, timeout):
+            requests.append((url, dict(params)))
+            response = MagicMock(status=200)
+            response.read = AsyncMock(return_value=b"line1\nline2\n")
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=False)
+            return context
+
+        manager._http = Mock(closed=False, get=get)
+        with (
+            patch.object(manager, "_get_proxy_port", AsyncMock(return_value=40123)),
+            patch.object(Path, "exists", return_value=True),
+        ):
+            result = await manager.get_logs("test-cluster", "web-0", container="app", tail_lines=50)
+
+        assert result["logs"] == "line1\nline2\n"
+        assert requests == [
+            (
+                "http://127.0.0.1:40123/api/v1/namespaces/default/pods/web-0/log",
+                {"tailLines": "50", "container": "app"},
+            )
+        ]
+        mock_run_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.run_async")
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_get_resources_comma_list_through_proxy(
+        self, mock_run, mock_run_async, mock_config
+    ):
+        """Test comma-separated types are listed per type over the proxy and merged in order."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+        manager._use_proxy = True
+
+        async def proxy_list(cluster_name, resource_type, namespace, label_selector, deadline):
+            return {"items": [{"kind": resource_type, "metadata": {"name": "a"}}]}
+
+        with patch.object(manager, "_proxy_list", side_effect=proxy_list) as mock_list:
+            result = await manager.get_resources("test-cluster", "pods,services")
+
+        assert [call.args[1] for call in mock_list.call_args_list] == ["pods", "services"]
+        assert [item["kind"] for item in result["resources"]] == ["pods", "services"]
+        assert result["count"] == 2
+        mock_run_async.assert_not_called()
+
+    def test_manifest_parse_cached_by_content(self):
+        """Test an identical manifest is parsed once while invalid ones keep failing."""
+        import yaml
+
+        from agent.cluster import kubectl_manager
+
+        kubectl_manager._checked_manifests.clear()
+        manifest = "apiVersion: v1\nkind: ConfigMap\n---\napiVersion: v1\nkind: Service\n"
+
+        with patch("yaml.load_all", wraps=yaml.load_all) as load_all:
+            kubectl_manager._check_manifest_yaml(manifest)
+            kubectl_manager._check_manifest_yaml(manifest)
+
+        assert load_all.call_count == 1
+        assert len(kubectl_manager._checked_manifests) == 1
+        for _ in range(2):
+            with pytest.raises(yaml.YAMLError):
+                kubectl_manager._check_manifest_yaml("this is not valid: yaml: ][")
+        assert len(kubectl_manager._checked_manifests) == 1
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.kubectl_manager.subprocess.run")
+    async def test_proxy_get_timeout_clamped_to_deadline(self, mock_run, mock_config):
+        """Test the proxy request timeout follows the caller's remaining deadline."""
+        mock_run.return_value = Mock(returncode=0, stdout="kubectl version")
+        manager = KubectlManager(mock_config)
+        timeouts = []
+
+        def get(url, params, timeout):
+            timeouts.append(timeout.total)
+            response = MagicMock(status=200)
+            response.read = AsyncMock(return_value=b"{}")
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=False)
+            return context
+
+        manager._http = Mock(closed=False, get=get)
+
+        await manager._proxy_get("test-cluster", 40123, "/api/v1/pods", {})
+        await manager._proxy_get(
+            "test-cluster", 40123, "/api/v1/pods", {}, deadline=time.monotonic() + 5
+        )
+
+        assert timeouts[0] == 30
+        assert 0 < timeouts[1] <= 5
+        with pytest.raises(KubectlCommandError):
+            await manager._proxy_get(
+                "test-cluster", 40123, "/api/v1/pods", {}, deadline=time.monotonic() - 1
+            )
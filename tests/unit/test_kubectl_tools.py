@@ -364,7 +364,7 @@ class TestKubectlTools:
     @patch("agent.cluster.tools.KindManager")
     @patch("agent.cluster.tools.ClusterStatus")
     def test_kubectl_tools_in_cluster_tools_list(self, mock_status, mock_kind, mock_kubectl):
-        """Test that kubectl tools are added to CLUSTER_TOOLS list."""
+        """Test that kubectl tools are registered in CLUSTER_TOOLS."""
         assert tools.kubectl_get_resources in tools.CLUSTER_TOOLS
         assert tools.kubectl_apply in tools.CLUSTER_TOOLS
         assert tools.kubectl_delete in tools.CLUSTER_TOOLS
@@ -431,3 +431,100 @@ class TestKubectlTools:
         result5 = await tools.kubectl_describe("test", "pod", "name")
         assert isinstance(result5, dict)
         assert "success" in result5 and result5["success"] is False
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.tools.KubectlManager")
+    @patch("agent.cluster.tools.KindManager")
+    @patch("agent.cluster.tools.ClusterStatus")
+    async def test_kubectl_get_resources_cached_until_apply(
+        self, mock_status, mock_kind, mock_kubectl
+    ):
+        """Test repeated queries reuse one kubectl call until the cluster is modified."""
+        config = Mock(spec=AgentConfig)
+        tools.initialize_tools(config)
+
+        mock_manager = Mock()
+        mock_manager.get_resources = AsyncMock(
+            return_value={"resources": [{"metadata": {"name": "pod-1"}}], "count": 1}
+        )
+        mock_manager.apply_manifest = AsyncMock(return_value={"resources": []})
+        tools._kubectl_manager = mock_manager
+
+        first = await tools.kubectl_get_resources("test-cluster", "pods")
+        first["resources"].clear()
+        second = await tools.kubectl_get_resources("test-cluster", "Pods")
+
+        assert mock_manager.get_resources.call_count == 1
+        assert second["count"] == 1
+        assert second["resources"] == [{"metadata": {"name": "pod-1"}}]
+
+        await tools.kubectl_apply("test-cluster", "manifest")
+        await tools.kubectl_get_resources("test-cluster", "pods")
+
+        assert mock_manager.get_resources.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.tools.KubectlManager")
+    @patch("agent.cluster.tools.KindManager")
+    @patch("agent.cluster.tools.ClusterStatus")
+    async def test_kubectl_describe_cached_until_delete(self, mock_status, mock_kind, mock_kubectl):
+        """Test repeated describes reuse one kubectl call until the cluster is modified."""
+        config = Mock(spec=AgentConfig)
+        tools.initialize_tools(config)
+
+        mock_manager = Mock()
+        mock_manager.describe_resource = AsyncMock(
+            return_value={"description": "Name: nginx", "resource_type": "pod", "name": "nginx"}
+        )
+        mock_manager.delete_resource = AsyncMock(return_value={"deleted": True})
+        tools._kubectl_manager = mock_manager
+
+        await tools.kubectl_describe("test-cluster", "pod", "nginx")
+        await tools.kubectl_describe("test-cluster", "Pod", "nginx")
+        await tools.kubectl_describe("test-cluster", "pod", "other")
+
+        assert mock_manager.describe_resource.call_count == 2
+
+        await tools.kubectl_delete("test-cluster", "pod", "other")
+        await tools.kubectl_describe("test-cluster", "pod", "nginx")
+
+        assert mock_manager.describe_resource.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.tools.KubectlManager")
+    @patch("agent.cluster.tools.KindManager")
+    @patch("agent.cluster.tools.ClusterStatus")
+    async def test_resource_cache_drops_expired_entries_and_idle_locks(
+        self, mock_status, mock_kind, mock_kubectl
+    ):
+        """Test expired listings are evicted on the next insert and no per-key lock lingers."""
+        config = Mock(spec=AgentConfig)
+        tools.initialize_tools(config)
+
+        mock_manager = Mock()
+        mock_manager.get_resources = AsyncMock(return_value={"resources": [], "count": 0})
+        tools._kubectl_manager = mock_manager
+
+        with patch("agent.cluster.tools.time.monotonic", return_value=100.0):
+            await tools.kubectl_get_resources("test-cluster", "secrets")
+        with patch("agent.cluster.tools.time.monotonic", return_value=200.0):
+            await tools.kubectl_get_resources("test-cluster", "pods")
+
+        assert [key[2] for key in tools._resource_cache] == ["pods"]
+        assert tools._resource_locks == {}
+
+    @pytest.mark.asyncio
+    @patch("agent.cluster.tools.KubectlManager")
+    @patch("agent.cluster.tools.KindManager")
+    @patch("agent.cluster.tools.ClusterStatus")
+    async def test_shutdown_tools_closes_kubectl_manager(
+        self, mock_status, mock_kind, mock_kubectl
+    ):
+        """Test shutdown closes the kubectl manager and the status probe threads."""
+        tools.initialize_tools(Mock(spec=AgentConfig))
+        mock_kubectl.return_value.close = AsyncMock()
+
+        await tools.shutdown_tools()
+
+        mock_kubectl.return_value.close.assert_awaited_once()
+        mock_status.return_value.close.assert_called_once()